@@ -42,8 +42,8 @@ def create_app() -> Flask:
     Returns:
         Flask: Configured Flask application instance
     """
-    # Initialize Flask app
-    app = Flask(__name__)
+    # Initialize Flask app; static assets are served by the web blueprint
+    app = Flask(__name__, static_folder=None)
 
     # Load configuration
     config = Config.init_app()
@@ -77,12 +77,14 @@ def create_app() -> Flask:
         logger.info("Initializing synthetic data generator...")
         generator = SyntheticHealthDataGenerator()
 
-        # Wire application services
-        app.config["APP_SERVICES"] = {
+        # Wire application services; routes read them from app.extensions
+        services = {
             "processor": processor,
             "classifier": classifier,
             "generator": generator,
         }
+        app.extensions["app_services"] = services
+        app.config["APP_SERVICES"] = services
 
         logger.info("All services initialized successfully")
 
@@ -98,7 +100,8 @@ def create_app() -> Flask:
     app.config['SESSION_KEY_PREFIX'] = 'phi_classifier:'
 
     # Initialize session if SAML is enabled
-    if os.environ.get('SAML_ENABLED', 'false').lower() == 'true':
+    saml_enabled = os.environ.get('SAML_ENABLED', 'false').lower() == 'true'
+    if saml_enabled:
         Session(app)
         logger.info("Flask-Session initialized for SAML authentication")
 
@@ -106,7 +109,7 @@ def create_app() -> Flask:
     app.register_blueprint(web_bp)
 
     # Register SAML blueprint if enabled
-    if os.environ.get('SAML_ENABLED', 'false').lower() == 'true':
+    if saml_enabled:
         try:
             from web.saml_auth import saml_bp
             app.register_blueprint(saml_bp)
@@ -117,25 +120,13 @@ def create_app() -> Flask:
     else:
         logger.info("SAML authentication disabled")
 
-    # Health check endpoint
-    @app.get("/health")
-    def health():
-        """Health check endpoint for load balancers"""
-        classifier = app.config["APP_SERVICES"]["classifier"]
-        model_info = classifier.get_model_info()
-
-        return {
-            "status": "healthy",
-            "version": "2.0.0",
-            "environment": config.ENVIRONMENT,
-            "models_loaded": model_info['models_available']
-        }
+    # /health is served by the web blueprint
 
     # Model information endpoint
     @app.get("/api/models/info")
     def model_info():
         """Get information about loaded ML models"""
-        classifier = app.config["APP_SERVICES"]["classifier"]
+        classifier = app.extensions["app_services"]["classifier"]
         return classifier.get_model_info()
 
     logger.info("Application created and services wired successfully")
@@ -14,11 +14,12 @@ __author__ = 'FredHutch PHI Classifier Team'
 from .hipaa_identifier import HIPAAIdentifier
 from .classifier import AdvancedPHIClassifier
 from .generator import SyntheticHealthDataGenerator
-from .security import SecurityManager
+from .security import SecurityManager, get_security_manager
 
 __all__ = [
     'HIPAAIdentifier',
     'AdvancedPHIClassifier', 
     'SyntheticHealthDataGenerator',
-    'SecurityManager'
+    'SecurityManager',
+    'get_security_manager'
 ]
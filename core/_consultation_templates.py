@@ -0,0 +1,90 @@
+"""
+Consultation note template variants for realistic medical documents.
+
+Imported on first use by ``core.realistic_templates``.
+"""
+
+VARIANTS = [
+    """{facility_name}
+CARDIOLOGY CONSULTATION
+
+PATIENT: {last_name}, {first_name}
+MRN: {mrn} | DOB: {date_of_birth} | Age: {age}
+Consultation Date: {consult_date}
+Requesting Physician: Dr. {referring_physician}
+Location: {visit_location}
+
+REASON FOR CONSULTATION:
+Cardiology evaluation for {consult_reason} in patient with known {primary_diagnosis}.
+
+HISTORY OF PRESENT ILLNESS:
+{full_name} is a {age}-year-old {gender} referred for cardiology assessment. {consult_hpi} Past medical history significant for {comorbidity1}, {comorbidity2}, and {comorbidity3}.
+
+Current cardiac medications: {cardiac_meds}
+
+REVIEW OF SYSTEMS:
+Cardiovascular: {cv_review}
+Respiratory: {resp_review}
+Constitutional: {constitutional_review}
+
+PHYSICAL EXAMINATION:
+Vital Signs: BP {bp_string}, HR {heart_rate}, RR {resp_rate}, T {temperature}F
+General: {general_exam}
+Cardiovascular: {cv_exam_detailed}
+Pulmonary: {lung_findings}
+Extremities: {extremity_exam}
+
+DIAGNOSTIC DATA REVIEWED:
+ECG ({ecg_date}): {ecg_findings}
+Echocardiogram ({echo_date}): {echo_findings}
+Labs ({lab_date}): {lab_findings}
+
+ASSESSMENT:
+{assessment_detailed}
+
+RECOMMENDATIONS:
+1. {recommendation1}
+2. {recommendation2}
+3. {recommendation3}
+4. {recommendation4}
+5. Follow-up in {followup_interval}
+
+Thank you for this interesting consultation. I will continue to follow. Please contact me at {consult_phone} with questions or concerns.
+
+{consultant_name}, MD, FACC
+Board Certified - Cardiovascular Disease
+NPI: {consultant_npi}
+""",
+
+    """{facility_name} - CONSULTATION REPORT
+
+Pt: {last_name}, {first_name} ({age}y.o. {gender})
+MRN {mrn} | DOB {date_of_birth}
+Date: {consult_date}
+Consulting Service: CARDIOLOGY
+Requesting MD: {referring_physician}
+
+REASON: {consult_reason}
+
+HPI: {consult_hpi_brief} PMH: {primary_diagnosis}, {comorbidity1}, {comorbidity2}.
+
+Meds: {cardiac_meds}
+
+ROS: {ros_brief}
+
+PE: VS: {bp_string}, HR {heart_rate}. {general_exam}. CV: {cv_exam_detailed}. Lungs: {lung_findings}.
+
+DATA: ECG {ecg_findings}. Echo {echo_findings}. Labs {lab_findings}.
+
+IMPRESSION: {assessment_brief}
+
+PLAN:
+{recommendation1}
+{recommendation2}
+{recommendation3}
+F/u cardiology clinic {followup_interval}
+
+{consultant_name}, MD | NPI {consultant_npi}
+{note_date}
+"""
+]
@@ -0,0 +1,84 @@
+"""
+Discharge summary template variants for realistic medical documents.
+
+Imported on first use by ``core.realistic_templates``.
+"""
+
+VARIANTS = [
+    # Variant 1: Comprehensive format
+    """{facility_name}
+{facility_address}
+{city}, {state} {zip_code}
+
+DISCHARGE SUMMARY
+
+PATIENT: {last_name}, {first_name}
+MRN: {mrn}
+DOB: {date_of_birth}
+AGE: {age} years
+ADMISSION: {admission_date}
+DISCHARGE: {discharge_date}
+ATTENDING: Dr. {attending_physician}
+
+ADMITTING DIAGNOSIS: {admission_diagnosis}
+DISCHARGE DIAGNOSIS: {discharge_diagnosis_list}
+
+HOSPITAL COURSE:
+{full_name} is a {age}-year-old {gender} admitted on {admission_date} with {admission_diagnosis}. {hospital_course_narrative}
+
+Initial labs showed {initial_labs}. Imaging studies {imaging_findings}. Patient was started on {treatment_regimen}.
+
+Consultations obtained:
+- Cardiology (Dr. {consultant1}): {consult_recommendation1}
+- {specialty2} (Dr. {consultant2}): {consult_recommendation2}
+
+{clinical_progress}
+
+By discharge on {discharge_date}, patient was {discharge_status}.
+
+DISCHARGE MEDICATIONS:
+{discharge_med_list}
+
+DISCHARGE INSTRUCTIONS:
+{discharge_instructions}
+
+FOLLOW-UP CARE:
+- PCP Dr. {pcp_name} in 1-2 weeks (call {pcp_phone} to schedule)
+- {specialty1} follow-up as arranged
+- Return to ED for {warning_signs}
+
+CONDITION AT DISCHARGE: {discharge_condition}
+
+Patient and family educated regarding discharge plan and expressed understanding. All questions answered.
+
+Attending Physician: Dr. {attending_physician}
+License: {physician_license}
+Dictated: {discharge_date}
+Authenticated: {note_date}
+""",
+
+    # Variant 2: Brief discharge summary
+    """{facility_name} - DISCHARGE SUMMARY
+
+Patient: {last_name}, {first_name} | MRN {mrn} | DOB {date_of_birth}
+Admitted: {admission_date} | Discharged: {discharge_date}
+
+DIAGNOSES:
+1. {admission_diagnosis}
+2. {secondary_diagnosis}
+
+BRIEF HOSPITAL COURSE:
+{age} y.o. {gender} admitted with {admission_diagnosis}. {hospital_course_brief} Consulted {specialty1} and {specialty2}. {treatment_summary} Patient improved and ready for discharge.
+
+DISCHARGE MEDS: {discharge_med_list}
+
+FOLLOW-UP:
+Dr. {pcp_name} ({pcp_phone}) in 1-2 weeks
+{specialty1} clinic prn
+
+INSTRUCTIONS: {discharge_instructions_brief}
+
+Dr. {attending_physician} (Lic# {physician_license})
+Completed {note_date}
+"""
+]
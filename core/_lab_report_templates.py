@@ -0,0 +1,65 @@
+"""
+Laboratory report template variants for realistic medical documents.
+
+Imported on first use by ``core.realistic_templates``.
+"""
+
+VARIANTS = [
+    """{facility_name} - Laboratory Services
+{facility_address}, {city}, {state} {zip_code}
+Phone: {lab_phone} | Fax: {lab_fax}
+
+LABORATORY REPORT
+
+PATIENT: {last_name}, {first_name}
+MRN: {mrn}
+DOB: {date_of_birth}
+AGE/SEX: {age} / {gender}
+
+COLLECTION DATE/TIME: {collection_date} {collection_time}
+RECEIVED: {received_datetime}
+REPORTED: {report_date}
+
+ORDERING PROVIDER: Dr. {ordering_physician}
+Phone: {provider_phone}
+
+TEST ORDERED: {test_panel_name}
+
+RESULTS:
+{detailed_lab_results}
+
+{abnormal_flags}
+
+REFERENCE RANGES PROVIDED
+
+INTERPRETATION:
+{test_interpretation}
+
+{critical_value_note}
+
+Performed by: {lab_name}
+CLIA #: {clia_number}
+Medical Director: {medical_director}, MD
+
+Report electronically signed {note_date}
+""",
+
+    """{lab_name} | CLIA# {clia_number}
+{city}, {state} | Ph: {lab_phone}
+
+LAB REPORT
+
+Pt: {last_name}, {first_name} | MRN {mrn} | DOB {date_of_birth}
+Collected: {collection_date} | Resulted: {report_date}
+Ordering MD: {ordering_physician} ({provider_phone})
+
+{test_panel_name}:
+{concise_lab_results}
+
+{abnormal_note}
+
+{critical_call_note}
+
+Dir: {medical_director}, MD | {note_date}
+"""
+]
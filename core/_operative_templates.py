@@ -0,0 +1,72 @@
+"""
+Operative note template variants for realistic medical documents.
+
+Imported on first use by ``core.realistic_templates``.
+"""
+
+VARIANTS = [
+    """{facility_name}
+OPERATIVE REPORT
+
+PATIENT: {last_name}, {first_name}
+MRN: {mrn} | DOB: {date_of_birth}
+DATE OF SURGERY: {surgery_date}
+LOCATION: {or_location}
+
+PREOPERATIVE DIAGNOSIS: {preop_diagnosis}
+POSTOPERATIVE DIAGNOSIS: {postop_diagnosis}
+PROCEDURE: {procedure_name}
+
+SURGEON: Dr. {surgeon_name}
+ASSISTANT: Dr. {assistant_name}
+ANESTHESIA: {anesthesia_type} - Dr. {anesthesiologist}
+
+INDICATIONS:
+{full_name} is a {age}-year-old {gender} with {indication_detail}. {indication_narrative} After thorough discussion of risks, benefits, and alternatives including {alternatives}, patient provided informed consent.
+
+DESCRIPTION OF PROCEDURE:
+{procedure_description_detailed}
+
+The procedure was completed successfully without intraoperative complications.
+
+FINDINGS: {operative_findings}
+EBL: {ebl} mL
+FLUIDS: {fluids_given}
+SPECIMENS: {specimen_description}
+DRAINS: {drain_description}
+DISPOSITION: {disposition}
+
+Patient tolerated procedure well and transferred to {post_location} in stable condition.
+
+SURGEON: Dr. {surgeon_name}
+License: {surgeon_license}
+
+Dictated: {surgery_date}
+Transcribed: {note_date}
+""",
+
+    """{facility_name} - OR NOTE
+
+Pt: {last_name}, {first_name} | MRN {mrn} | DOB {date_of_birth}
+Date: {surgery_date}
+
+Preop Dx: {preop_diagnosis}
+Postop Dx: {postop_diagnosis}
+Procedure: {procedure_name}
+
+Surgeon: {surgeon_name} | Assist: {assistant_name} | Anes: {anesthesiologist}
+
+Indications: {age} y.o. {gender} with {indication_detail}. {indication_narrative}
+
+Procedure: {procedure_description_brief}
+
+Findings: {operative_findings}
+EBL: {ebl}mL | Complications: {complications}
+Specimens: {specimen_description}
+
+Patient to {post_location} stable.
+
+Dr. {surgeon_name} (Lic {surgeon_license})
+Signed {note_date}
+"""
+]
@@ -0,0 +1,126 @@
+"""
+Progress note template variants for realistic medical documents.
+
+Imported on first use by ``core.realistic_templates``.
+"""
+
+VARIANTS = [
+    # Variant 1: Standard format
+    """{facility_name}
+{city}, {state} {zip_code}
+
+PROGRESS NOTE
+
+Patient: {last_name}, {first_name}
+MRN: {mrn}
+DOB: {date_of_birth}
+Visit Date: {visit_date}
+Provider: {attending_physician}
+
+CHIEF COMPLAINT: {chief_complaint}
+
+HPI:
+{hpi_narrative}
+
+CURRENT MEDICATIONS:
+{medication_list_narrative}
+
+ALLERGIES: {allergy_list_simple}
+
+PHYSICAL EXAM:
+Vitals: BP {bp_string} | HR {heart_rate} | T {temperature}F | Wt {weight} lbs | RR {resp_rate}
+General: {general_exam}
+CV: {cv_exam}
+Lungs: {resp_exam}
+Abd: {abd_exam}
+
+ASSESSMENT/PLAN:
+{assessment_plan}
+
+{clinical_reasoning}
+
+Patient counseled and questions answered. Verbalized understanding.
+
+Next appointment: {next_visit_date}
+Patient contact: {phone_mobile}
+
+{attending_physician}, MD
+NPI: {physician_npi}
+Note signed: {note_date}
+""",
+
+    # Variant 2: Condensed style
+    """{facility_name} | {city}, {state}
+
+OFFICE VISIT NOTE
+{visit_date}
+
+Pt: {last_name}, {first_name} | MRN {mrn} | DOB {date_of_birth}
+
+CC: Follow-up {primary_diagnosis}
+
+HPI: {hpi_narrative}
+
+Meds: {medication_list_narrative}
+Allergies: {allergy_list_simple}
+
+VS: {bp_string}, P{heart_rate}, T{temperature}, Wt {weight}#
+Exam: {general_exam}. {cv_exam}. {resp_exam}. {abd_exam}.
+
+A/P:
+{assessment_plan}
+{clinical_reasoning}
+
+Discussed plan with patient who agrees and understands.
+F/u {next_visit_date} or prn. Can reach at {phone_mobile}.
+
+{attending_physician}, MD (NPI {physician_npi})
+Signed {note_date}
+""",
+
+    # Variant 3: Narrative-heavy style
+    """{facility_name}
+Department of Internal Medicine
+{facility_address}, {city}, {state} {zip_code}
+
+OUTPATIENT PROGRESS NOTE
+
+PATIENT INFORMATION:
+Name: {last_name}, {first_name}
+Medical Record Number: {mrn}
+Date of Birth: {date_of_birth} (Age: {age} years)
+Date of Service: {visit_date}
+Attending Physician: Dr. {attending_physician}
+
+HISTORY OF PRESENT ILLNESS:
+{hpi_narrative}
+
+Patient is currently taking the following medications: {medication_list_narrative}. Reports good adherence with no missed doses. Known drug allergies: {allergy_list_simple}.
+
+VITAL SIGNS:
+Blood Pressure: {bp_string} mmHg
+Heart Rate: {heart_rate} bpm
+Temperature: {temperature}°F
+Weight: {weight} lbs
+Respiratory Rate: {resp_rate} /min
+
+PHYSICAL EXAMINATION:
+General Appearance: {general_exam}
+Cardiovascular: {cv_exam}
+Respiratory: {resp_exam}
+Abdominal: {abd_exam}
+
+CLINICAL IMPRESSION AND PLAN:
+{assessment_plan}
+
+{clinical_reasoning}
+
+The patient demonstrates good understanding of the treatment plan and has been counseled regarding warning signs requiring immediate medical attention. Contact information on file: {phone_mobile}.
+
+Follow-up scheduled for {next_visit_date}.
+
+Electronically signed by Dr. {attending_physician}
+Provider NPI: {physician_npi}
+Document date/time: {note_date}
+"""
+]
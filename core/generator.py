@@ -40,9 +40,9 @@ try:
 except ImportError:
     HAS_OPENPYXL = False
 
-from .security import SecurityManager
+from .security import get_security_manager
 from .clinical_coherence import ClinicalCoherenceEngine
-from .realistic_templates import get_realistic_template, get_clinical_phrase, CLINICAL_VOCABULARY
+from .realistic_templates import get_realistic_template, get_clinical_phrase, render_template, CLINICAL_VOCABULARY
 
 logger = logging.getLogger(__name__)
 
@@ -504,7 +504,7 @@ class SyntheticHealthDataGenerator:
     """
     
     def __init__(self):
-        self.security_manager = SecurityManager()
+        self.security_manager = get_security_manager()
         self.medical_vocabulary = ComprehensiveMedicalVocabulary()
         self.clinical_coherence = ClinicalCoherenceEngine()
 
@@ -1483,37 +1483,37 @@ Date: {datetime.now().strftime('%m/%d/%Y')}
 
         # Generate dynamic HPI narrative using clinical vocabulary
         hpi_template = random.choice(CLINICAL_VOCABULARY['hpi_templates'])
-        hpi_narrative = hpi_template.format(
-            first_name=patient.first_name,
-            last_name=patient.last_name,
-            age=patient.age,
-            gender=patient.gender,
-            primary_diagnosis=patient.primary_diagnosis,
-            symptom_quality=get_clinical_phrase('symptom_qualities'),
-            symptom_frequency=get_clinical_phrase('symptom_frequencies'),
-            symptom_context=get_clinical_phrase('symptom_contexts'),
-            time_reference=get_clinical_phrase('time_references'),
-            symptom_status=get_clinical_phrase('symptom_statuses'),
-            adherence_statement=get_clinical_phrase('adherence_statements'),
-            symptom_description=get_clinical_phrase('symptom_qualities'),
-            temporal_pattern='has been gradually improving',
-            functional_status='able to perform usual activities',
-            visit_type='follow-up evaluation',
-            symptom_course='Symptoms have remained stable.',
-            specific_complaint='good control with current therapy',
-            impact_statement='Patient able to work and exercise without limitation.'
-        )
+        hpi_narrative = render_template(hpi_template, {
+            'first_name': patient.first_name,
+            'last_name': patient.last_name,
+            'age': patient.age,
+            'gender': patient.gender,
+            'primary_diagnosis': patient.primary_diagnosis,
+            'symptom_quality': get_clinical_phrase('symptom_qualities'),
+            'symptom_frequency': get_clinical_phrase('symptom_frequencies'),
+            'symptom_context': get_clinical_phrase('symptom_contexts'),
+            'time_reference': get_clinical_phrase('time_references'),
+            'symptom_status': get_clinical_phrase('symptom_statuses'),
+            'adherence_statement': get_clinical_phrase('adherence_statements'),
+            'symptom_description': get_clinical_phrase('symptom_qualities'),
+            'temporal_pattern': 'has been gradually improving',
+            'functional_status': 'able to perform usual activities',
+            'visit_type': 'follow-up evaluation',
+            'symptom_course': 'Symptoms have remained stable.',
+            'specific_complaint': 'good control with current therapy',
+            'impact_statement': 'Patient able to work and exercise without limitation.'
+        })
 
         # Generate varied assessment/plan
         followup_intervals = ['2-3 months', '3 months', '3-4 months', '4-6 months', '6 months', '12 weeks']
         assessment_template = random.choice(CLINICAL_VOCABULARY['assessment_plans'])
-        assessment_plan = assessment_template.format(
-            diagnosis=patient.primary_diagnosis,
-            med1=patient.medications[0]['generic_name'] if patient.medications else 'current medication',
-            med2=patient.medications[1]['generic_name'] if len(patient.medications) > 1 else 'multivitamin',
-            dose1=patient.medications[0].get('strength', '').split()[0] if patient.medications else '',
-            interval=random.choice(followup_intervals)
-        )
+        assessment_plan = render_template(assessment_template, {
+            'diagnosis': patient.primary_diagnosis,
+            'med1': patient.medications[0]['generic_name'] if patient.medications else 'current medication',
+            'med2': patient.medications[1]['generic_name'] if len(patient.medications) > 1 else 'multivitamin',
+            'dose1': patient.medications[0].get('strength', '').split()[0] if patient.medications else '',
+            'interval': random.choice(followup_intervals)
+        })
 
         # Generate comprehensive template data with extensive variation
         template_data = {
@@ -1698,7 +1698,7 @@ Date: {datetime.now().strftime('%m/%d/%Y')}
         }
 
         try:
-            return template.format(**template_data)
+            return render_template(template, template_data)
         except KeyError as e:
             logger.warning(f"Template key error: {e}. Using fallback.")
             # Fallback template with minimal fields
@@ -64,7 +64,7 @@ try:
 except ImportError:
     HAS_OCR = False
 
-from .security import SecurityManager
+from .security import get_security_manager
 
 logger = logging.getLogger(__name__)
 
@@ -75,7 +75,7 @@ class DocumentProcessor:
     """
     
     def __init__(self):
-        self.security_manager = SecurityManager()
+        self.security_manager = get_security_manager()
         
         # Supported file formats and their processors
         self.processors = {
@@ -150,7 +150,8 @@ class DocumentProcessor:
                     file_obj.seek(0)
             
             # Security validation
-            if not self.security_manager.validate_file(file_obj if not isinstance(file_obj, str) else filename):
+            if not self.security_manager.validate_file(file_obj if not isinstance(file_obj, str) else filename,
+                                                       content=file_content):
                 return self._create_error_result(filename, "Security validation failed")
             
             # Detect file type
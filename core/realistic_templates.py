@@ -13,12 +13,22 @@ Key characteristics:
 - Mimics actual EHR/medical record output with provider variability
 """
 
+import importlib
 import random
+import re
+import string
+from array import array
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Dedicated Mersenne Twister instance for template and phrase sampling; its bound
+# methods are captured as default arguments to skip the module-level indirection
+_RNG = random.Random()
 
 # Extensive clinical vocabulary for realistic variation
 CLINICAL_VOCABULARY = {
     'hpi_templates': [
-        "{first_name} {last_name} is a {age}-year-old {gender} with history of {primary_diagnosis} presenting for follow-up. Patient reports {symptom_quality} symptoms {symptom_frequency}. {symptom_context}",
+        "{full_name} is a {age}-year-old {gender} with history of {primary_diagnosis} presenting for follow-up. Patient reports {symptom_quality} symptoms {symptom_frequency}. {symptom_context}",
         "Patient presents as scheduled for routine management of {primary_diagnosis}. Since last visit {time_reference}, symptoms have been {symptom_status}. {adherence_statement}",
         "Seen today for ongoing care of {primary_diagnosis}. Patient describes {symptom_description} that {temporal_pattern}. Currently {functional_status}.",
         "{age} y.o. {gender} returning for {visit_type} of {primary_diagnosis}. {symptom_course} Reports {specific_complaint}. {impact_statement}",
@@ -113,435 +123,178 @@ CLINICAL_VOCABULARY = {
     ]
 }
 
-PROGRESS_NOTE_VARIANTS = [
-    # Variant 1: Standard format
-    """{facility_name}
-{city}, {state} {zip_code}
-
-PROGRESS NOTE
-
-Patient: {last_name}, {first_name}
-MRN: {mrn}
-DOB: {date_of_birth}
-Visit Date: {visit_date}
-Provider: {attending_physician}
-
-CHIEF COMPLAINT: {chief_complaint}
-
-HPI:
-{hpi_narrative}
-
-CURRENT MEDICATIONS:
-{medication_list_narrative}
-
-ALLERGIES: {allergy_list_simple}
-
-PHYSICAL EXAM:
-Vitals: BP {bp_systolic}/{bp_diastolic} | HR {heart_rate} | T {temperature}F | Wt {weight} lbs | RR {resp_rate}
-General: {general_exam}
-CV: {cv_exam}
-Lungs: {resp_exam}
-Abd: {abd_exam}
-
-ASSESSMENT/PLAN:
-{assessment_plan}
-
-{clinical_reasoning}
-
-Patient counseled and questions answered. Verbalized understanding.
-
-Next appointment: {next_visit_date}
-Patient contact: {phone_mobile}
-
-{attending_physician}, MD
-NPI: {physician_npi}
-Note signed: {note_date}
-""",
-
-    # Variant 2: Condensed style
-    """{facility_name} | {city}, {state}
-
-OFFICE VISIT NOTE
-{visit_date}
-
-Pt: {last_name}, {first_name} | MRN {mrn} | DOB {date_of_birth}
-
-CC: Follow-up {primary_diagnosis}
-
-HPI: {hpi_narrative}
-
-Meds: {medication_list_narrative}
-Allergies: {allergy_list_simple}
-
-VS: {bp_systolic}/{bp_diastolic}, P{heart_rate}, T{temperature}, Wt {weight}#
-Exam: {general_exam}. {cv_exam}. {resp_exam}. {abd_exam}.
-
-A/P:
-{assessment_plan}
-{clinical_reasoning}
-
-Discussed plan with patient who agrees and understands.
-F/u {next_visit_date} or prn. Can reach at {phone_mobile}.
-
-{attending_physician}, MD (NPI {physician_npi})
-Signed {note_date}
-""",
-
-    # Variant 3: Narrative-heavy style
-    """{facility_name}
-Department of Internal Medicine
-{facility_address}, {city}, {state} {zip_code}
-
-OUTPATIENT PROGRESS NOTE
-
-PATIENT INFORMATION:
-Name: {last_name}, {first_name}
-Medical Record Number: {mrn}
-Date of Birth: {date_of_birth} (Age: {age} years)
-Date of Service: {visit_date}
-Attending Physician: Dr. {attending_physician}
-
-HISTORY OF PRESENT ILLNESS:
-{hpi_narrative}
-
-Patient is currently taking the following medications: {medication_list_narrative}. Reports good adherence with no missed doses. Known drug allergies: {allergy_list_simple}.
-
-VITAL SIGNS:
-Blood Pressure: {bp_systolic}/{bp_diastolic} mmHg
-Heart Rate: {heart_rate} bpm
-Temperature: {temperature}°F
-Weight: {weight} lbs
-Respiratory Rate: {resp_rate} /min
-
-PHYSICAL EXAMINATION:
-General Appearance: {general_exam}
-Cardiovascular: {cv_exam}
-Respiratory: {resp_exam}
-Abdominal: {abd_exam}
-
-CLINICAL IMPRESSION AND PLAN:
-{assessment_plan}
-
-{clinical_reasoning}
-
-The patient demonstrates good understanding of the treatment plan and has been counseled regarding warning signs requiring immediate medical attention. Contact information on file: {phone_mobile}.
-
-Follow-up scheduled for {next_visit_date}.
-
-Electronically signed by Dr. {attending_physician}
-Provider NPI: {physician_npi}
-Document date/time: {note_date}
-"""
-]
-
-DISCHARGE_SUMMARY_VARIANTS = [
-    # Variant 1: Comprehensive format
-    """{facility_name}
-{facility_address}
-{city}, {state} {zip_code}
-
-DISCHARGE SUMMARY
-
-PATIENT: {last_name}, {first_name}
-MRN: {mrn}
-DOB: {date_of_birth}
-AGE: {age} years
-ADMISSION: {admission_date}
-DISCHARGE: {discharge_date}
-ATTENDING: Dr. {attending_physician}
-
-ADMITTING DIAGNOSIS: {admission_diagnosis}
-DISCHARGE DIAGNOSIS: {discharge_diagnosis_list}
-
-HOSPITAL COURSE:
-{first_name} {last_name} is a {age}-year-old {gender} admitted on {admission_date} with {admission_diagnosis}. {hospital_course_narrative}
-
-Initial labs showed {initial_labs}. Imaging studies {imaging_findings}. Patient was started on {treatment_regimen}.
-
-Consultations obtained:
-- Cardiology (Dr. {consultant1}): {consult_recommendation1}
-- {specialty2} (Dr. {consultant2}): {consult_recommendation2}
-
-{clinical_progress}
-
-By discharge on {discharge_date}, patient was {discharge_status}.
-
-DISCHARGE MEDICATIONS:
-{discharge_med_list}
-
-DISCHARGE INSTRUCTIONS:
-{discharge_instructions}
-
-FOLLOW-UP CARE:
-- PCP Dr. {pcp_name} in 1-2 weeks (call {pcp_phone} to schedule)
-- {specialty1} follow-up as arranged
-- Return to ED for {warning_signs}
-
-CONDITION AT DISCHARGE: {discharge_condition}
-
-Patient and family educated regarding discharge plan and expressed understanding. All questions answered.
-
-Attending Physician: Dr. {attending_physician}
-License: {physician_license}
-Dictated: {discharge_date}
-Authenticated: {note_date}
-""",
-
-    # Variant 2: Brief discharge summary
-    """{facility_name} - DISCHARGE SUMMARY
-
-Patient: {last_name}, {first_name} | MRN {mrn} | DOB {date_of_birth}
-Admitted: {admission_date} | Discharged: {discharge_date}
-
-DIAGNOSES:
-1. {admission_diagnosis}
-2. {secondary_diagnosis}
-
-BRIEF HOSPITAL COURSE:
-{age} y.o. {gender} admitted with {admission_diagnosis}. {hospital_course_brief} Consulted {specialty1} and {specialty2}. {treatment_summary} Patient improved and ready for discharge.
-
-DISCHARGE MEDS: {discharge_med_list}
-
-FOLLOW-UP:
-Dr. {pcp_name} ({pcp_phone}) in 1-2 weeks
-{specialty1} clinic prn
-
-INSTRUCTIONS: {discharge_instructions_brief}
-
-Dr. {attending_physician} (Lic# {physician_license})
-Completed {note_date}
-"""
-]
-
-CONSULTATION_NOTE_VARIANTS = [
-    """{facility_name}
-CARDIOLOGY CONSULTATION
-
-PATIENT: {last_name}, {first_name}
-MRN: {mrn} | DOB: {date_of_birth} | Age: {age}
-Consultation Date: {consult_date}
-Requesting Physician: Dr. {referring_physician}
-Location: {visit_location}
-
-REASON FOR CONSULTATION:
-Cardiology evaluation for {consult_reason} in patient with known {primary_diagnosis}.
-
-HISTORY OF PRESENT ILLNESS:
-{first_name} {last_name} is a {age}-year-old {gender} referred for cardiology assessment. {consult_hpi} Past medical history significant for {comorbidity1}, {comorbidity2}, and {comorbidity3}.
-
-Current cardiac medications: {cardiac_meds}
-
-REVIEW OF SYSTEMS:
-Cardiovascular: {cv_review}
-Respiratory: {resp_review}
-Constitutional: {constitutional_review}
-
-PHYSICAL EXAMINATION:
-Vital Signs: BP {bp_systolic}/{bp_diastolic}, HR {heart_rate}, RR {resp_rate}, T {temperature}F
-General: {general_exam}
-Cardiovascular: {cv_exam_detailed}
-Pulmonary: {lung_findings}
-Extremities: {extremity_exam}
-
-DIAGNOSTIC DATA REVIEWED:
-ECG ({ecg_date}): {ecg_findings}
-Echocardiogram ({echo_date}): {echo_findings}
-Labs ({lab_date}): {lab_findings}
-
-ASSESSMENT:
-{assessment_detailed}
-
-RECOMMENDATIONS:
-1. {recommendation1}
-2. {recommendation2}
-3. {recommendation3}
-4. {recommendation4}
-5. Follow-up in {followup_interval}
-
-Thank you for this interesting consultation. I will continue to follow. Please contact me at {consult_phone} with questions or concerns.
-
-{consultant_name}, MD, FACC
-Board Certified - Cardiovascular Disease
-NPI: {consultant_npi}
-""",
-
-    """{facility_name} - CONSULTATION REPORT
-
-Pt: {last_name}, {first_name} ({age}y.o. {gender})
-MRN {mrn} | DOB {date_of_birth}
-Date: {consult_date}
-Consulting Service: CARDIOLOGY
-Requesting MD: {referring_physician}
-
-REASON: {consult_reason}
-
-HPI: {consult_hpi_brief} PMH: {primary_diagnosis}, {comorbidity1}, {comorbidity2}.
-
-Meds: {cardiac_meds}
-
-ROS: {ros_brief}
-
-PE: VS: {bp_systolic}/{bp_diastolic}, HR {heart_rate}. {general_exam}. CV: {cv_exam_detailed}. Lungs: {lung_findings}.
-
-DATA: ECG {ecg_findings}. Echo {echo_findings}. Labs {lab_findings}.
-
-IMPRESSION: {assessment_brief}
-
-PLAN:
-{recommendation1}
-{recommendation2}
-{recommendation3}
-F/u cardiology clinic {followup_interval}
-
-{consultant_name}, MD | NPI {consultant_npi}
-{note_date}
-"""
-]
-
-LAB_REPORT_VARIANTS = [
-    """{facility_name} - Laboratory Services
-{facility_address}, {city}, {state} {zip_code}
-Phone: {lab_phone} | Fax: {lab_fax}
-
-LABORATORY REPORT
-
-PATIENT: {last_name}, {first_name}
-MRN: {mrn}
-DOB: {date_of_birth}
-AGE/SEX: {age} / {gender}
-
-COLLECTION DATE/TIME: {collection_date} {collection_time}
-RECEIVED: {received_datetime}
-REPORTED: {report_date}
-
-ORDERING PROVIDER: Dr. {ordering_physician}
-Phone: {provider_phone}
-
-TEST ORDERED: {test_panel_name}
-
-RESULTS:
-{detailed_lab_results}
-
-{abnormal_flags}
-
-REFERENCE RANGES PROVIDED
-
-INTERPRETATION:
-{test_interpretation}
-
-{critical_value_note}
-
-Performed by: {lab_name}
-CLIA #: {clia_number}
-Medical Director: {medical_director}, MD
-
-Report electronically signed {note_date}
-""",
-
-    """{lab_name} | CLIA# {clia_number}
-{city}, {state} | Ph: {lab_phone}
-
-LAB REPORT
-
-Pt: {last_name}, {first_name} | MRN {mrn} | DOB {date_of_birth}
-Collected: {collection_date} | Resulted: {report_date}
-Ordering MD: {ordering_physician} ({provider_phone})
-
-{test_panel_name}:
-{concise_lab_results}
-
-{abnormal_note}
-
-{critical_call_note}
-
-Dir: {medical_director}, MD | {note_date}
-"""
-]
-
-OPERATIVE_NOTE_VARIANTS = [
-    """{facility_name}
-OPERATIVE REPORT
-
-PATIENT: {last_name}, {first_name}
-MRN: {mrn} | DOB: {date_of_birth}
-DATE OF SURGERY: {surgery_date}
-LOCATION: {or_location}
-
-PREOPERATIVE DIAGNOSIS: {preop_diagnosis}
-POSTOPERATIVE DIAGNOSIS: {postop_diagnosis}
-PROCEDURE: {procedure_name}
-
-SURGEON: Dr. {surgeon_name}
-ASSISTANT: Dr. {assistant_name}
-ANESTHESIA: {anesthesia_type} - Dr. {anesthesiologist}
-
-INDICATIONS:
-{first_name} {last_name} is a {age}-year-old {gender} with {indication_detail}. {indication_narrative} After thorough discussion of risks, benefits, and alternatives including {alternatives}, patient provided informed consent.
-
-DESCRIPTION OF PROCEDURE:
-{procedure_description_detailed}
-
-The procedure was completed successfully without intraoperative complications.
-
-FINDINGS: {operative_findings}
-EBL: {ebl} mL
-FLUIDS: {fluids_given}
-SPECIMENS: {specimen_description}
-DRAINS: {drain_description}
-DISPOSITION: {disposition}
-
-Patient tolerated procedure well and transferred to {post_location} in stable condition.
-
-SURGEON: Dr. {surgeon_name}
-License: {surgeon_license}
-
-Dictated: {surgery_date}
-Transcribed: {note_date}
-""",
-
-    """{facility_name} - OR NOTE
-
-Pt: {last_name}, {first_name} | MRN {mrn} | DOB {date_of_birth}
-Date: {surgery_date}
-
-Preop Dx: {preop_diagnosis}
-Postop Dx: {postop_diagnosis}
-Procedure: {procedure_name}
-
-Surgeon: {surgeon_name} | Assist: {assistant_name} | Anes: {anesthesiologist}
-
-Indications: {age} y.o. {gender} with {indication_detail}. {indication_narrative}
+def _pack_phrases(phrases: List[str]) -> Tuple[bytes, array]:
+    """
+    Pack phrases into one contiguous ASCII blob plus an (offset, length) table.
+    """
+    encoded = [phrase.encode('ascii') for phrase in phrases]
+    offsets = array('i')
+    cursor = 0
+    for phrase in encoded:
+        offsets.append(cursor)
+        offsets.append(len(phrase))
+        cursor += len(phrase)
+    return b''.join(encoded), offsets
+
+def _pack_vocabulary(vocabulary: Dict[str, Any]) -> Dict[Tuple[str, Optional[str]], Tuple[bytes, array]]:
+    """
+    Flatten the clinical vocabulary into packed blobs keyed by (category, subcategory).
+    """
+    packed = {}
+    for category, options in vocabulary.items():
+        if isinstance(options, dict):
+            for subcategory, sub_options in options.items():
+                packed[(category, subcategory)] = _pack_phrases(sub_options)
+        else:
+            packed[(category, None)] = _pack_phrases(options)
+    return packed
+
+# Sampling structure for get_clinical_phrase (all clinical phrases are ASCII)
+_VOCAB_BLOBS = _pack_vocabulary(CLINICAL_VOCABULARY)
+
+# Template variants live in per-document-type modules imported on first use,
+# so a process only allocates the templates it actually renders
+_TEMPLATE_MODULES = {
+    'progress_note': '._progress_templates',
+    'discharge_summary': '._discharge_templates',
+    'consultation_note': '._consultation_templates',
+    'lab_report_focused': '._lab_report_templates',
+    'operative_note': '._operative_templates'
+}
 
-Procedure: {procedure_description_brief}
+# Small integer IDs for hot loops: resolve once, then select by list index
+DOC_TYPE_IDS = {doc_type: type_id for type_id, doc_type in enumerate(_TEMPLATE_MODULES)}
+_DOC_TYPES_BY_ID = tuple(_TEMPLATE_MODULES)
+_VARIANTS_BY_ID: List[Optional[List[str]]] = [None] * len(_DOC_TYPES_BY_ID)
+
+# Legacy module-level variant list names, resolved lazily via __getattr__
+_VARIANT_ATTRIBUTES = {
+    'PROGRESS_NOTE_VARIANTS': 'progress_note',
+    'DISCHARGE_SUMMARY_VARIANTS': 'discharge_summary',
+    'CONSULTATION_NOTE_VARIANTS': 'consultation_note',
+    'LAB_REPORT_VARIANTS': 'lab_report_focused',
+    'OPERATIVE_NOTE_VARIANTS': 'operative_note'
+}
 
-Findings: {operative_findings}
-EBL: {ebl}mL | Complications: {complications}
-Specimens: {specimen_description}
+# Templates only use plain {name} placeholders (no conversions, format specs,
+# attribute or index access); enforced by _check_placeholders at load time
+_PLACEHOLDER_RE = re.compile(r'\{(\w+)\}')
+
+_BLANK_LINE_RUN_RE = re.compile(r'\n{3,}')
+_TRAILING_SPACE_RE = re.compile(r'[ \t]+\n')
+
+# Generated render functions keyed by template source string, filled per document type
+_COMPILED_FN: Dict[str, Callable[[Dict[str, Any]], str]] = {}
+
+def _import_variants(doc_type: str) -> List[str]:
+    """Import the template module for a document type and return its variants."""
+    return importlib.import_module(_TEMPLATE_MODULES[doc_type], __package__).VARIANTS
+
+def _normalize_template(template: str) -> str:
+    """
+    Canonicalize template whitespace: strip the ends, drop trailing spaces on
+    each line and collapse runs of blank lines, leaving a single final newline.
+    """
+    template = _TRAILING_SPACE_RE.sub('\n', template.strip())
+    return _BLANK_LINE_RUN_RE.sub('\n\n', template) + '\n'
+
+def _check_placeholders(template: str) -> None:
+    """Raise ValueError if ``template`` uses anything beyond plain ``{name}`` fields."""
+    for _, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if field_name is not None and (conversion or format_spec or not field_name.isidentifier()):
+            raise ValueError(f"Unsupported template placeholder {{{field_name}}}: only plain {{name}} fields are allowed")
+
+# The vocabulary snippets are rendered through the regex substituter
+for _snippet in CLINICAL_VOCABULARY['hpi_templates'] + CLINICAL_VOCABULARY['assessment_plans']:
+    _check_placeholders(_snippet)
+
+def _compile_render_function(name: str, template: str) -> Callable[[Dict[str, Any]], str]:
+    """
+    Generate a function that renders ``template`` from a field dict.
+
+    The body is a single f-string expression with every literal inlined, e.g.
+    ``return ('Patient: ' f"{f['last_name']}" ', ' f"{f['first_name']}" ...)``,
+    so rendering needs no per-call template parsing. A missing field raises
+    ``KeyError`` just like ``str.format``.
+    """
+    parts = []
+    for literal, field_name, _, _ in string.Formatter().parse(template):
+        if literal:
+            parts.append(repr(literal))
+        if field_name is not None:
+            parts.append(f'f"{{f[{field_name!r}]}}"')
+
+    source = f"def {name}(f):\n    return ({' '.join(parts) or repr('')})\n"
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, f"<realistic template {name}>", 'exec'), namespace)
+    return namespace[name]
+
+@lru_cache(maxsize=None)
+def _load_variants(doc_type: str) -> List[str]:
+    """
+    Load the template variants for a document type, normalizing and compiling
+    them on first use.
+    """
+    variants = [_normalize_template(template) for template in _import_variants(doc_type)]
+    for i, template in enumerate(variants):
+        _check_placeholders(template)
+        _COMPILED_FN[template] = _compile_render_function(f"_render_{doc_type}_v{i + 1}", template)
+    _VARIANTS_BY_ID[DOC_TYPE_IDS[doc_type]] = variants
+    return variants
+
+def __getattr__(name: str) -> Any:
+    if name in _VARIANT_ATTRIBUTES:
+        return _load_variants(_VARIANT_ATTRIBUTES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def render_template(template: str, fields: Dict[str, Any]) -> str:
+    """
+    Render a realistic template with the given field values.
+
+    Composite fields (``full_name``, ``bp_string``) are derived once per
+    document here so templates reference a single placeholder instead of
+    repeating ``{first_name} {last_name}`` or ``{bp_systolic}/{bp_diastolic}``.
+    They are added to a copy; the caller's ``fields`` dict is not modified.
+
+    Known template variants render through their generated render function;
+    any other string (e.g. the vocabulary snippets) goes through a single
+    precompiled regex substitution. A missing field raises ``KeyError`` in
+    both cases.
+    """
+    composite = {}
+    if 'first_name' in fields and 'last_name' in fields:
+        composite['full_name'] = f"{fields['first_name']} {fields['last_name']}"
+    if 'bp_systolic' in fields and 'bp_diastolic' in fields:
+        composite['bp_string'] = f"{fields['bp_systolic']}/{fields['bp_diastolic']}"
+    if composite:
+        fields = {**fields, **composite}
+
+    render = _COMPILED_FN.get(template)
+    if render is None:
+        return _PLACEHOLDER_RE.sub(lambda m: str(fields[m.group(1)]), template)
+    return render(fields)
+
+def get_realistic_template(doc_type: str, _choice=_RNG.choice) -> str:
+    """Get a random realistic template for the specified document type."""
+    variants = _load_variants(doc_type if doc_type in _TEMPLATE_MODULES else 'progress_note')
+    return _choice(variants)
 
-Patient to {post_location} stable.
+def get_realistic_template_by_id(type_id: int, _choice=_RNG.choice) -> str:
+    """
+    Get a random realistic template by document type ID (see ``DOC_TYPE_IDS``).
 
-Dr. {surgeon_name} (Lic {surgeon_license})
-Signed {note_date}
-"""
-]
+    Callers generating many documents of one type resolve the ID once and skip
+    the per-call string hashing of ``get_realistic_template``.
+    """
+    variants = _VARIANTS_BY_ID[type_id] or _load_variants(_DOC_TYPES_BY_ID[type_id])
+    return _choice(variants)
 
-def get_realistic_template(doc_type: str) -> str:
-    """Get a random realistic template for the specified document type."""
-    template_map = {
-        'progress_note': PROGRESS_NOTE_VARIANTS,
-        'discharge_summary': DISCHARGE_SUMMARY_VARIANTS,
-        'consultation_note': CONSULTATION_NOTE_VARIANTS,
-        'lab_report_focused': LAB_REPORT_VARIANTS,
-        'operative_note': OPERATIVE_NOTE_VARIANTS
-    }
-
-    variants = template_map.get(doc_type, PROGRESS_NOTE_VARIANTS)
-    return random.choice(variants)
-
-def get_clinical_phrase(category: str, subcategory: str = None) -> str:
+def get_clinical_phrase(category: str, subcategory: str = None, _randrange=_RNG.randrange) -> str:
     """Get a random clinical phrase from the vocabulary."""
-    if subcategory:
-        options = CLINICAL_VOCABULARY.get(category, {}).get(subcategory, ['Normal'])
-    else:
-        options = CLINICAL_VOCABULARY.get(category, ['Normal finding'])
-    return random.choice(options)
+    packed = _VOCAB_BLOBS.get((category, subcategory or None))
+    if packed is None:
+        return 'Normal' if subcategory else 'Normal finding'
+    blob, offsets = packed
+    i = _randrange(len(offsets) // 2) * 2
+    offset = offsets[i]
+    return blob[offset:offset + offsets[i + 1]].decode('ascii')
@@ -10,44 +10,204 @@ HIPAA-compliant security management system providing:
 
 import os
 import re
+import json
+import time
+import atexit
+import threading
 import hashlib
 import secrets
 import logging
 import tempfile
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, timedelta
-import uuid
+from dataclasses import dataclass
+import base64
+from functools import lru_cache
 
 # Cryptography imports
 try:
     from cryptography.fernet import Fernet
+    from cryptography.exceptions import InvalidTag
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
     from cryptography.hazmat.primitives import hashes
     from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-    import base64
     HAS_CRYPTOGRAPHY = True
 except ImportError:
     HAS_CRYPTOGRAPHY = False
 
+# Optional RE2 engine for linear-time combined scans
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+# Optional orjson for faster audit record encoding
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional BLAKE3 for faster content hashing
+try:
+    from blake3 import blake3 as _content_hasher
+    HASH_ALGORITHM = 'blake3'
+except ImportError:
+    _content_hasher = hashlib.sha256
+    HASH_ALGORITHM = 'sha256'
+
 logger = logging.getLogger(__name__)
 
+# AES-256-GCM key length, and how long to wait for another process to finish writing it
+AEAD_KEY_SIZE = 32
+KEY_READ_ATTEMPTS = 50
+KEY_READ_RETRY_DELAY = 0.05
+
+# AES-GCM nonce length; stored ciphertext is nonce || ciphertext || tag
+GCM_NONCE_SIZE = 12
+
+# Read size when hashing file-like objects
+HASH_CHUNK_SIZE = 1 << 20
+
+# Audit log buffering: flush once this many bytes are pending, and never let a
+# record wait longer than this many seconds (a timer is armed by the first
+# record buffered after a flush)
+AUDIT_BUFFER_SIZE = 64 << 10
+AUDIT_FLUSH_INTERVAL = 1.0
+
+# Any of these makes a filename unsafe: '.', '..' anywhere, a leading separator, a backtick
+_UNSAFE_FILENAME_RE = re.compile(r'^\.$|\.\.|^[\\/]|`')
+
+# Windows device names that cannot be used as a file stem
+_RESERVED_FILENAMES = frozenset({'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'LPT1'})
+
+# (epoch second, formatted prefix) reused by _iso_timestamp within the same second
+_ts_cache: Tuple[Optional[int], str] = (None, '')
+
+def _iso_timestamp() -> str:
+    """
+    Local ISO-8601 timestamp with microseconds, as datetime.now().isoformat()
+    gives, reformatting the date/time prefix only when the second changes
+    """
+    global _ts_cache
+    sec, usec = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(sec))
+        _ts_cache = (sec, prefix)
+    return f'{prefix}.{usec:06d}'
+
+# Security validation patterns
+MALICIOUS_PATTERNS = (
+    r'<script[^>]*>.*?</script>',
+    r'javascript:',
+    r'vbscript:',
+    r'onload\s*=',
+    r'onerror\s*=',
+    r'eval\s*\(',
+    r'exec\s*\(',
+    r'\.\./.*\.\.',  # Path traversal
+    r'\\\\.*\\\\',  # UNC paths
+)
+
+SUSPICIOUS_PATTERNS = (
+    r'password\s*[:=]\s*[^\s]+',
+    r'api_key\s*[:=]\s*[^\s]+',
+    r'secret\s*[:=]\s*[^\s]+',
+    r'token\s*[:=]\s*[^\s]+'
+)
+
+PHI_PATTERNS = (
+    r'\b\d{3}-\d{2}-\d{4}\b',  # SSN
+    r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',  # Email
+    r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',  # Phone
+    r'\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b'  # Dates
+)
+
+@dataclass(frozen=True)
+class _SecurityPatterns:
+    """
+    Compiled security patterns; each *_src and *_re tuple pair shares indices.
+    The *_bytes variants run on raw bytes so file samples need no decoding.
+    """
+    malicious_src: Tuple[str, ...]
+    malicious_re: Tuple[Any, ...]
+    malicious_scan: Any
+    malicious_re_bytes: Tuple[Any, ...]
+    malicious_scan_bytes: Any
+    suspicious_src: Tuple[str, ...]
+    suspicious_re: Tuple[Any, ...]
+    suspicious_scan: Any
+    suspicious_re_bytes: Tuple[Any, ...]
+    suspicious_scan_bytes: Any
+    phi_src: Tuple[str, ...]
+    phi_re: Tuple[Any, ...]
+
+def _compile_security_patterns() -> _SecurityPatterns:
+    """
+    Compile security patterns once; malicious and suspicious categories also get a
+    single combined alternation so a clean document is decided in one pass
+    """
+    # Flags are inlined so the same source compiles under RE2 as well
+    engine = re2 if HAS_RE2 else re
+    malicious_scan = '(?is)' + '|'.join(f'(?P<g{i}>{p})' for i, p in enumerate(MALICIOUS_PATTERNS))
+    suspicious_scan = '(?i)' + '|'.join(f'(?P<g{i}>{p})' for i, p in enumerate(SUSPICIOUS_PATTERNS))
+    return _SecurityPatterns(
+        malicious_src=MALICIOUS_PATTERNS,
+        malicious_re=tuple(re.compile(p, re.IGNORECASE | re.DOTALL) for p in MALICIOUS_PATTERNS),
+        malicious_scan=engine.compile(malicious_scan),
+        malicious_re_bytes=tuple(re.compile(p.encode('ascii'), re.IGNORECASE | re.DOTALL) for p in MALICIOUS_PATTERNS),
+        malicious_scan_bytes=engine.compile(malicious_scan.encode('ascii')),
+        suspicious_src=SUSPICIOUS_PATTERNS,
+        suspicious_re=tuple(re.compile(p, re.IGNORECASE) for p in SUSPICIOUS_PATTERNS),
+        suspicious_scan=engine.compile(suspicious_scan),
+        suspicious_re_bytes=tuple(re.compile(p.encode('ascii'), re.IGNORECASE) for p in SUSPICIOUS_PATTERNS),
+        suspicious_scan_bytes=engine.compile(suspicious_scan.encode('ascii')),
+        phi_src=PHI_PATTERNS,
+        phi_re=tuple(re.compile(p, re.IGNORECASE) for p in PHI_PATTERNS)
+    )
+
+_SEC_PATTERNS = _compile_security_patterns()
+
+# Path separators, shell-special and control characters mapped to '_' by sanitize_filename
+_FILENAME_UNSAFE_CHARS = '<>:"/\\|?*' + ''.join(map(chr, range(0x20))) + ''.join(map(chr, range(0x7f, 0xa0)))
+_FILENAME_TRANS = str.maketrans(dict.fromkeys(_FILENAME_UNSAFE_CHARS, '_'))
+
 class SecurityManager:
     """
     Comprehensive security manager for HIPAA-compliant operations
     """
     
+    # Directory setup and key loading are process-wide; done once per process
+    _shared_directories: Optional[Dict[str, Path]] = None
+    _shared_ciphers: Optional[Tuple[Any, Any, bytes]] = None
+    
+    # Audit log writer shared by all instances: one O_APPEND descriptor and buffer
+    _audit_fd: Optional[int] = None
+    _audit_buf = bytearray()
+    _audit_lock = threading.Lock()
+    _audit_timer: Optional[threading.Timer] = None
+    
     def __init__(self):
         self.secret_key = secrets.token_hex(32)
         self.max_file_size = 50 * 1024 * 1024  # 50MB
         self.allowed_extensions = {'.txt', '.docx', '.pdf', '.csv', '.xlsx', '.json'}
+        self._extension_suffixes = tuple(self.allowed_extensions)
         self.secure_directories = self._initialize_secure_directories()
+        self._open_audit_log()
         
         # Initialize encryption if available
         if HAS_CRYPTOGRAPHY:
             self._initialize_encryption()
+        self.encryption_enabled = HAS_CRYPTOGRAPHY and getattr(self, 'cipher_suite', None) is not None
         
-        # Security patterns for content validation
-        self.security_patterns = self._initialize_security_patterns()
+        # Bind the storage/encryption variants once instead of re-checking per call
+        if not self.encryption_enabled:
+            self.secure_file_storage = self._secure_file_storage_plain
+            self.encrypt_content = self._encryption_unavailable
+            self.decrypt_content = self._encryption_unavailable
         
         logger.info("Security Manager initialized with HIPAA-compliant settings")
     
@@ -55,6 +215,9 @@ class SecurityManager:
         """
         Initialize secure directories with proper permissions
         """
+        if SecurityManager._shared_directories is not None:
+            return dict(SecurityManager._shared_directories)
+        
         try:
             base_path = Path('/opt/phi-classifier')
         except:
@@ -83,68 +246,159 @@ class SecurityManager:
                 temp_dir.mkdir(exist_ok=True)
                 directories[name] = temp_dir
         
-        return directories
+        SecurityManager._shared_directories = directories
+        return dict(directories)
+    
+    def _open_audit_log(self):
+        """
+        Open the persistent audit log descriptor once per process
+        """
+        with SecurityManager._audit_lock:
+            if SecurityManager._audit_fd is not None:
+                return
+            try:
+                log_file = self.secure_directories['logs'] / 'security_audit.log'
+                SecurityManager._audit_fd = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+                atexit.register(SecurityManager._close_audit_log)
+            except OSError as e:
+                logger.error(f"Failed to open security audit log: {e}")
+    
+    @classmethod
+    def _flush_audit_locked(cls):
+        """
+        Write out pending audit records; caller holds _audit_lock
+        """
+        if cls._audit_fd is not None and cls._audit_buf:
+            view = memoryview(cls._audit_buf)
+            while view:
+                view = view[os.write(cls._audit_fd, view):]
+            view.release()
+            cls._audit_buf.clear()
+        if cls._audit_timer is not None:
+            cls._audit_timer.cancel()
+            cls._audit_timer = None
+    
+    @classmethod
+    def flush_audit_log(cls):
+        """
+        Flush buffered audit records to disk
+        """
+        with cls._audit_lock:
+            cls._flush_audit_locked()
+    
+    @classmethod
+    def _reset_audit_after_fork(cls):
+        """
+        Drop audit writer state inherited across fork; the parent flushes its own buffer
+        """
+        cls._audit_lock = threading.Lock()
+        cls._audit_buf = bytearray()
+        cls._audit_timer = None
+    
+    @classmethod
+    def _close_audit_log(cls):
+        """
+        Flush and close the audit log descriptor at interpreter exit
+        """
+        with cls._audit_lock:
+            cls._flush_audit_locked()
+            if cls._audit_fd is not None:
+                os.close(cls._audit_fd)
+                cls._audit_fd = None
     
     def _initialize_encryption(self):
         """
         Initialize encryption capabilities
         """
+        if SecurityManager._shared_ciphers is not None:
+            self.cipher_suite, self.legacy_cipher, self._gcm_key = SecurityManager._shared_ciphers
+            return
+        
+        self.legacy_cipher = None
+        key_dir = self.secure_directories['keys']
+        
+        # Generate or load the AES-256-GCM key and build its cipher. Failures here
+        # propagate rather than falling back to cipher_suite=None, which would
+        # store PHI unencrypted.
+        key_file = key_dir / 'master_aead.key'
         try:
-            # Generate or load encryption key
-            key_file = self.secure_directories['keys'] / 'master.key'
-            
-            if key_file.exists():
-                with open(key_file, 'rb') as f:
-                    key = f.read()
-            else:
-                key = Fernet.generate_key()
-                with open(key_file, 'wb') as f:
-                    f.write(key)
-                os.chmod(key_file, 0o600)  # Owner read/write only
-            
-            self.cipher_suite = Fernet(key)
-            logger.info("Encryption system initialized")
-            
-        except Exception as e:
-            logger.error(f"Failed to initialize encryption: {e}")
-            self.cipher_suite = None
+            fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)  # Owner read/write only
+        except FileExistsError:
+            key = self._read_aead_key(key_file)
+        else:
+            key = AESGCM.generate_key(bit_length=256)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(key)
+        
+        self.cipher_suite = AESGCM(key)
+        self._gcm_key = key
+        
+        # Keep the old Fernet key around so previously stored content still decrypts;
+        # an unusable legacy key only loses that fallback, never the AES-GCM cipher
+        legacy_key_file = key_dir / 'master.key'
+        if legacy_key_file.exists():
+            try:
+                with open(legacy_key_file, 'rb') as f:
+                    self.legacy_cipher = Fernet(f.read())
+            except Exception as e:
+                logger.error(f"Failed to load legacy Fernet key, old content will not decrypt: {e}")
+                self.legacy_cipher = None
+        
+        SecurityManager._shared_ciphers = (self.cipher_suite, self.legacy_cipher, key)
+        logger.info("Encryption system initialized")
+    
+    @staticmethod
+    def _read_aead_key(key_file: Path) -> bytes:
+        """
+        Read an existing AES-GCM key, waiting out a concurrent process still writing it
+        """
+        for _ in range(KEY_READ_ATTEMPTS):
+            with open(key_file, 'rb') as f:
+                key = f.read()
+            if len(key) == AEAD_KEY_SIZE:
+                return key
+            if len(key) > AEAD_KEY_SIZE:
+                break
+            time.sleep(KEY_READ_RETRY_DELAY)
+        raise ValueError(f"Encryption key {key_file} is {len(key)} bytes, expected {AEAD_KEY_SIZE}")
+    
+    def _encrypt(self, data: bytes) -> bytes:
+        """
+        Encrypt raw bytes with AES-GCM, prefixing the random nonce
+        """
+        nonce = os.urandom(GCM_NONCE_SIZE)
+        return nonce + self.cipher_suite.encrypt(nonce, data, None)
+    
+    def _decrypt(self, data: bytes) -> bytes:
+        """
+        Decrypt nonce-prefixed AES-GCM bytes, falling back to legacy Fernet tokens
+        """
+        try:
+            return self.cipher_suite.decrypt(data[:GCM_NONCE_SIZE], data[GCM_NONCE_SIZE:], None)
+        except InvalidTag:
+            if self.legacy_cipher is None:
+                raise
+            return self.legacy_cipher.decrypt(data)
     
-    def _initialize_security_patterns(self) -> Dict[str, List[str]]:
+    @property
+    def security_patterns(self) -> Dict[str, List[str]]:
         """
-        Initialize security validation patterns
+        Security validation pattern sources, keyed by category
         """
         return {
-            'malicious_patterns': [
-                r'<script[^>]*>.*?</script>',
-                r'javascript:',
-                r'vbscript:',
-                r'onload\s*=',
-                r'onerror\s*=',
-                r'eval\s*\(',
-                r'exec\s*\(',
-                r'\.\./.*\.\.',  # Path traversal
-                r'\\\\.*\\\\',  # UNC paths
-            ],
-            'suspicious_content': [
-                r'password\s*[:=]\s*[^\s]+',
-                r'api_key\s*[:=]\s*[^\s]+',
-                r'secret\s*[:=]\s*[^\s]+',
-                r'token\s*[:=]\s*[^\s]+'
-            ],
-            'phi_patterns': [
-                r'\b\d{3}-\d{2}-\d{4}\b',  # SSN
-                r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',  # Email
-                r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',  # Phone
-                r'\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b'  # Dates
-            ]
+            'malicious_patterns': list(_SEC_PATTERNS.malicious_src),
+            'suspicious_content': list(_SEC_PATTERNS.suspicious_src),
+            'phi_patterns': list(_SEC_PATTERNS.phi_src)
         }
     
-    def validate_file(self, file_obj) -> bool:
+    def validate_file(self, file_obj, content: Optional[bytes] = None) -> bool:
         """
         Comprehensive file validation
         
         Args:
             file_obj: File object or file path to validate
+            content (Optional[bytes]): Full file bytes if the caller already read them;
+                used for the size and content sample instead of re-reading file_obj
             
         Returns:
             bool: True if file is valid and safe
@@ -153,12 +407,18 @@ class SecurityManager:
             # Get filename and size
             if hasattr(file_obj, 'filename'):
                 filename = file_obj.filename
-                file_obj.seek(0, 2)  # Seek to end
-                file_size = file_obj.tell()
-                file_obj.seek(0)  # Reset to beginning
+                if content is not None:
+                    file_size = len(content)
+                else:
+                    file_obj.seek(0, 2)  # Seek to end
+                    file_size = file_obj.tell()
+                    file_obj.seek(0)  # Reset to beginning
             elif isinstance(file_obj, str):
                 filename = file_obj
-                file_size = os.path.getsize(file_obj) if os.path.exists(file_obj) else 0
+                if content is not None:
+                    file_size = len(content)
+                else:
+                    file_size = os.path.getsize(file_obj) if os.path.exists(file_obj) else 0
             else:
                 logger.warning("Invalid file object provided")
                 return False
@@ -180,10 +440,14 @@ class SecurityManager:
             
             # Content validation if accessible
             if hasattr(file_obj, 'read'):
-                content_sample = file_obj.read(1024).decode('utf-8', errors='ignore')
-                file_obj.seek(0)  # Reset
+                # Patterns are ASCII, so the raw head is scanned as bytes
+                if content is not None:
+                    content_sample = content[:1024]
+                else:
+                    content_sample = file_obj.read(1024)
+                    file_obj.seek(0)  # Reset
                 
-                is_safe, threats = self.validate_content_security(content_sample)
+                is_safe, threats = self.validate_content_security(content_sample, report_all=False)
                 if not is_safe:
                     logger.warning(f"Content security validation failed: {threats}")
                     return False
@@ -217,8 +481,9 @@ class SecurityManager:
         if not filename:
             return False
         
-        file_extension = Path(filename).suffix.lower()
-        return file_extension in self.allowed_extensions
+        # A bare '.txt' is a dotfile with no suffix, as Path.suffix treats it
+        lowered = filename.lower()
+        return lowered.endswith(self._extension_suffixes) and lowered.rpartition('/')[2] not in self.allowed_extensions
     
     def sanitize_filename(self, filename: str) -> str:
         """
@@ -233,14 +498,8 @@ class SecurityManager:
         if not filename:
             return "unnamed_file.txt"
         
-        # Remove path separators and dangerous characters
-        sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
-        
-        # Remove control characters
-        sanitized = re.sub(r'[\x00-\x1f\x7f-\x9f]', '_', sanitized)
-        
-        # Limit length
-        sanitized = sanitized[:255]
+        # Replace path separators, dangerous and control characters; limit length
+        sanitized = filename.translate(_FILENAME_TRANS)[:255]
         
         # Ensure it has a valid extension
         if '.' not in sanitized:
@@ -258,45 +517,57 @@ class SecurityManager:
         Returns:
             bool: True if filename is safe
         """
-        if not filename or filename in ['.', '..']:
-            return False
-        
-        # Check for path traversal attempts
-        if '..' in filename or filename.startswith('/'):
+        # Bare '.', path traversal, absolute POSIX/Windows paths and backticks
+        if not filename or _UNSAFE_FILENAME_RE.search(filename):
             return False
         
-        # Check for reserved names (Windows compatibility)
-        reserved_names = {'CON', 'PRN', 'AUX', 'NUL', 'COM1', 'COM2', 'COM3', 'LPT1'}
-        name_without_ext = Path(filename).stem.upper()
-        if name_without_ext in reserved_names:
-            return False
-        
-        return True
+        # Check for reserved names (Windows compatibility); stem as Path(filename).stem computes it
+        basename = filename.rpartition('/')[2]
+        stem = basename.rpartition('.')[0] or basename
+        return stem.upper() not in _RESERVED_FILENAMES
     
-    def validate_content_security(self, content: str) -> Tuple[bool, List[str]]:
+    def validate_content_security(self, content, report_all: bool = True) -> Tuple[bool, List[str]]:
         """
         Validate content for security threats
         
         Args:
-            content (str): Content to validate
+            content (str | bytes): Content to validate; bytes are scanned without decoding
+            report_all (bool): Name every matching pattern; when False, stop at the
+                first malicious match and report only that one
             
         Returns:
             Tuple[bool, List[str]]: (is_safe, list_of_threats_found)
         """
         threats_found = []
         
+        patterns = _SEC_PATTERNS
+        if isinstance(content, (bytes, bytearray)):
+            malicious_scan, malicious_re = patterns.malicious_scan_bytes, patterns.malicious_re_bytes
+            suspicious_scan, suspicious_re = patterns.suspicious_scan_bytes, patterns.suspicious_re_bytes
+        else:
+            malicious_scan, malicious_re = patterns.malicious_scan, patterns.malicious_re
+            suspicious_scan, suspicious_re = patterns.suspicious_scan, patterns.suspicious_re
+        
         try:
-            # Check for malicious patterns
-            for pattern in self.security_patterns['malicious_patterns']:
-                matches = re.findall(pattern, content, re.IGNORECASE | re.DOTALL)
-                if matches:
-                    threats_found.append(f"Malicious pattern: {pattern}")
+            # Check for malicious patterns; only name them when the combined scan hits.
+            # One pass on the calling thread: CPython's re holds the GIL while matching,
+            # so spreading patterns over a thread pool would serialize anyway.
+            match = malicious_scan.search(content)
+            if match and not report_all:
+                group = next(name for name, value in match.groupdict().items() if value is not None)
+                threat = f"Malicious pattern: {patterns.malicious_src[int(group[1:])]}"
+                logger.warning(f"Content security validation failed: {threat}")
+                return False, [threat]
+            if match:
+                for source, regex in zip(patterns.malicious_src, malicious_re):
+                    if regex.search(content):
+                        threats_found.append(f"Malicious pattern: {source}")
             
             # Check for suspicious content (but don't block, just warn)
-            for pattern in self.security_patterns['suspicious_content']:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                if matches:
-                    logger.warning(f"Suspicious content pattern found: {pattern}")
+            if suspicious_scan.search(content):
+                for source, regex in zip(patterns.suspicious_src, suspicious_re):
+                    if regex.search(content):
+                        logger.warning(f"Suspicious content pattern found: {source}")
             
             is_safe = len(threats_found) == 0
             
@@ -316,23 +587,37 @@ class SecurityManager:
         Returns:
             str: Unique document ID
         """
-        return str(uuid.uuid4())
+        # 128 random bits as 26 lowercase base32 characters; filesystem-safe
+        return base64.b32encode(os.urandom(16)).rstrip(b'=').decode('ascii').lower()
     
-    def generate_file_hash(self, content: bytes) -> str:
+    def generate_file_hash(self, content) -> str:
         """
-        Generate SHA-256 hash of file content
+        Generate BLAKE3 (or SHA-256 fallback) hash of file content
         
         Args:
-            content (bytes): File content
+            content: File content as bytes, or a binary file-like object
             
         Returns:
-            str: SHA-256 hash
+            str: Hex digest
+        """
+        hasher = _content_hasher()
+        if hasattr(content, 'read'):
+            for chunk in iter(lambda: content.read(HASH_CHUNK_SIZE), b''):
+                hasher.update(chunk)
+        else:
+            hasher.update(content)
+        return hasher.hexdigest()
+    
+    def _encryption_unavailable(self, content) -> None:
+        """
+        encrypt_content/decrypt_content stand-in bound when no cipher is available
         """
-        return hashlib.sha256(content).hexdigest()
+        logger.warning("Encryption not available")
+        return None
     
     def encrypt_content(self, content: str) -> Optional[bytes]:
         """
-        Encrypt content using Fernet encryption
+        Encrypt content using AES-GCM encryption
         
         Args:
             content (str): Content to encrypt
@@ -340,19 +625,15 @@ class SecurityManager:
         Returns:
             Optional[bytes]: Encrypted content or None if encryption fails
         """
-        if not HAS_CRYPTOGRAPHY or not hasattr(self, 'cipher_suite') or not self.cipher_suite:
-            logger.warning("Encryption not available")
-            return None
-        
         try:
-            return self.cipher_suite.encrypt(content.encode('utf-8'))
+            return self._encrypt(content.encode('utf-8'))
         except Exception as e:
             logger.error(f"Encryption error: {e}")
             return None
     
     def decrypt_content(self, encrypted_content: bytes) -> Optional[str]:
         """
-        Decrypt content using Fernet encryption
+        Decrypt content using AES-GCM encryption
         
         Args:
             encrypted_content (bytes): Encrypted content
@@ -360,12 +641,8 @@ class SecurityManager:
         Returns:
             Optional[str]: Decrypted content or None if decryption fails
         """
-        if not HAS_CRYPTOGRAPHY or not hasattr(self, 'cipher_suite') or not self.cipher_suite:
-            logger.warning("Encryption not available")
-            return None
-        
         try:
-            return self.cipher_suite.decrypt(encrypted_content).decode('utf-8')
+            return self._decrypt(encrypted_content).decode('utf-8')
         except Exception as e:
             logger.error(f"Decryption error: {e}")
             return None
@@ -382,39 +659,70 @@ class SecurityManager:
             Optional[str]: Secure file path or None if storage fails
         """
         try:
-            # Generate secure filename
-            file_id = self.generate_document_id()
-            secure_filename = f"{file_id}_{self.sanitize_filename(filename)}"
-            secure_path = self.secure_directories['processed'] / secure_filename
-            
-            # Encrypt content if available
-            if HAS_CRYPTOGRAPHY and hasattr(self, 'cipher_suite') and self.cipher_suite:
-                encrypted_content = self.cipher_suite.encrypt(content)
-                storage_content = encrypted_content
-            else:
-                storage_content = content
-            
-            # Write to secure location
-            with open(secure_path, 'wb') as f:
-                f.write(storage_content)
+            secure_path = self._new_secure_path(filename)
+            hasher = _content_hasher()
+            
+            # Hash, encrypt and write in a single pass; the streaming GCM output
+            # (nonce || ciphertext || tag) matches what _decrypt expects
+            nonce = os.urandom(GCM_NONCE_SIZE)
+            encryptor = Cipher(algorithms.AES(self._gcm_key), modes.GCM(nonce)).encryptor()
+            fd = os.open(secure_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(nonce)
+                view = memoryview(content)
+                for offset in range(0, len(view), HASH_CHUNK_SIZE):
+                    chunk = view[offset:offset + HASH_CHUNK_SIZE]
+                    hasher.update(chunk)
+                    f.write(encryptor.update(chunk))
+                f.write(encryptor.finalize())
+                f.write(encryptor.tag)
+            
+            self._log_file_stored(filename, secure_path, hasher, encrypted=True)
+            return str(secure_path)
             
-            # Set secure permissions
-            os.chmod(secure_path, 0o600)
+        except Exception as e:
+            logger.error(f"Secure file storage error: {e}")
+            return None
+    
+    def _secure_file_storage_plain(self, content: bytes, filename: str) -> Optional[str]:
+        """
+        secure_file_storage without encryption, bound in __init__ when no cipher is available
+        """
+        try:
+            secure_path = self._new_secure_path(filename)
+            hasher = _content_hasher()
+            hasher.update(content)
             
-            # Log the storage operation
-            self.log_security_event("file_stored", {
-                'filename': filename,
-                'secure_path': str(secure_path),
-                'file_hash': self.generate_file_hash(content),
-                'encrypted': HAS_CRYPTOGRAPHY and hasattr(self, 'cipher_suite') and self.cipher_suite is not None
-            })
+            fd = os.open(secure_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
             
+            self._log_file_stored(filename, secure_path, hasher, encrypted=False)
             return str(secure_path)
             
         except Exception as e:
             logger.error(f"Secure file storage error: {e}")
             return None
     
+    def _new_secure_path(self, filename: str) -> Path:
+        """
+        Unique path under the processed directory for a stored file
+        """
+        secure_filename = f"{self.generate_document_id()}_{self.sanitize_filename(filename)}"
+        return self.secure_directories['processed'] / secure_filename
+    
+    def _log_file_stored(self, filename: str, secure_path: Path, hasher, encrypted: bool):
+        """
+        Log the storage operation
+        """
+        self.log_security_event("file_stored", {
+            'filename': filename,
+            'secure_path': str(secure_path),
+            'file_hash': hasher.hexdigest(),
+            'hash_algorithm': HASH_ALGORITHM,
+            'encrypted': encrypted
+        })
+    
     def log_security_event(self, event_type: str, event_data: Dict[str, Any]):
         """
         Log security events for audit trail
@@ -425,16 +733,28 @@ class SecurityManager:
         """
         try:
             log_entry = {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': _iso_timestamp(),
                 'event_type': event_type,
                 'event_data': event_data,
                 'session_id': getattr(self, 'session_id', 'unknown')
             }
             
-            # Write to secure log file
-            log_file = self.secure_directories['logs'] / 'security_audit.log'
-            with open(log_file, 'a') as f:
-                f.write(f"{json.dumps(log_entry)}\n")
+            if HAS_ORJSON:
+                record = orjson.dumps(log_entry, option=orjson.OPT_APPEND_NEWLINE)
+            else:
+                record = (json.dumps(log_entry, ensure_ascii=False) + '\n').encode('utf-8')
+            
+            # Buffer into the secure log file; flushed when the buffer fills, by a
+            # timer at most AUDIT_FLUSH_INTERVAL after the first pending record, or at exit
+            cls = SecurityManager
+            with cls._audit_lock:
+                cls._audit_buf += record
+                if len(cls._audit_buf) >= AUDIT_BUFFER_SIZE:
+                    cls._flush_audit_locked()
+                elif cls._audit_timer is None:
+                    cls._audit_timer = threading.Timer(AUDIT_FLUSH_INTERVAL, cls.flush_audit_log)
+                    cls._audit_timer.daemon = True
+                    cls._audit_timer.start()
             
             # Also log to standard logger
             logger.info(f"Security Event [{event_type}]: {event_data}")
@@ -480,15 +800,14 @@ class SecurityManager:
             max_age_hours (int): Maximum age of temp files in hours
         """
         try:
-            temp_dir = self.secure_directories['temp']
-            cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
+            cutoff_time = time.time() - max_age_hours * 3600
             
+            # DirEntry caches the file type from the directory read, so only mtime needs a stat
             cleaned_count = 0
-            for temp_file in temp_dir.glob('*'):
-                if temp_file.is_file():
-                    file_time = datetime.fromtimestamp(temp_file.stat().st_mtime)
-                    if file_time < cutoff_time:
-                        temp_file.unlink()
+            with os.scandir(self.secure_directories['temp']) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False) and entry.stat(follow_symlinks=False).st_mtime < cutoff_time:
+                        os.unlink(entry.path)
                         cleaned_count += 1
             
             if cleaned_count > 0:
@@ -509,20 +828,22 @@ class SecurityManager:
         log_files_count = 0
         
         try:
-            temp_files_count = len(list(self.secure_directories['temp'].glob('*')))
-            log_files_count = len(list(self.secure_directories['logs'].glob('*.log')))
+            with os.scandir(self.secure_directories['temp']) as entries:
+                temp_files_count = sum(1 for _ in entries)
+            with os.scandir(self.secure_directories['logs']) as entries:
+                log_files_count = sum(1 for entry in entries if entry.name.endswith('.log'))
         except:
             pass
         
         return {
-            'encryption_available': HAS_CRYPTOGRAPHY and hasattr(self, 'cipher_suite') and self.cipher_suite is not None,
+            'encryption_available': self.encryption_enabled,
             'secure_directories': {k: str(v) for k, v in self.secure_directories.items()},
             'max_file_size': self.max_file_size,
             'allowed_extensions': list(self.allowed_extensions),
-            'security_patterns_loaded': len(self.security_patterns['malicious_patterns']),
+            'security_patterns_loaded': len(_SEC_PATTERNS.malicious_src),
             'temp_files_count': temp_files_count,
             'log_files_count': log_files_count,
-            'initialization_time': datetime.now().isoformat()
+            'initialization_time': _iso_timestamp()
         }
     
     def validate_phi_content(self, text: str) -> Dict[str, Any]:
@@ -538,27 +859,32 @@ class SecurityManager:
         phi_indicators = {}
         total_matches = 0
         
-        for pattern in self.security_patterns['phi_patterns']:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for source, regex in zip(_SEC_PATTERNS.phi_src, _SEC_PATTERNS.phi_re):
+            matches = regex.findall(text)
             if matches:
-                phi_indicators[pattern] = matches
+                phi_indicators[source] = matches
                 total_matches += len(matches)
         
         return {
             'phi_indicators_found': phi_indicators,
             'total_phi_matches': total_matches,
             'likely_contains_phi': total_matches > 0,
-            'analysis_timestamp': datetime.now().isoformat()
+            'analysis_timestamp': _iso_timestamp()
         }
-    
-    def __del__(self):
-        """
-        Cleanup on destruction
-        """
-        try:
-            # Clean up temp files on exit
-            self.cleanup_temp_files(max_age_hours=1)
-        except:
-            pass  # Ignore errors during cleanup
 
-import json
\ No newline at end of file
+
+# A forked child (e.g. a preloaded gunicorn worker) gets no timer thread and may
+# inherit the audit lock in a held state, so it starts with a fresh writer
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=SecurityManager._reset_audit_after_fork)
+
+
+@lru_cache(maxsize=1)
+def get_security_manager() -> SecurityManager:
+    """
+    Return the process-wide SecurityManager, constructing it on first use
+    """
+    manager = SecurityManager()
+    # Sweep stale temp files once at exit (runs before the audit log is closed)
+    atexit.register(manager.cleanup_temp_files, max_age_hours=1)
+    return manager
@@ -13,27 +13,171 @@ Includes:
 """
 
 import os
-import requests
-import json
 import re
 import logging
-from typing import Dict, List, Optional, Any, Tuple
-from functools import lru_cache
-from datetime import datetime, timedelta
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any
 import time
 import hashlib
 
-# Advanced NLP imports
+# Optional Aho-Corasick automaton for the single-word medical vocabulary
 try:
-    from transformers import AutoTokenizer, AutoModel, pipeline
-    import torch
-    import numpy as np
-    HAS_TRANSFORMERS = True
+    import ahocorasick
+    HAS_AHOCORASICK = True
 except ImportError:
-    HAS_TRANSFORMERS = False
+    HAS_AHOCORASICK = False
+
+# Optional RE2 engine for linear-time medical pattern scans
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
 
 logger = logging.getLogger(__name__)
 
+# Number of analyze_medical_context results kept per UMLSVocabularySystem
+CONTEXT_CACHE_SIZE = 1024
+
+# Single medical words picked up by _extract_medical_terms (whole-word, case-insensitive)
+MEDICAL_WORDS = (
+    'heart', 'lung', 'liver', 'kidney', 'brain', 'blood', 'bone', 'muscle',
+    'diabetes', 'cancer', 'pneumonia', 'infection', 'fracture', 'surgery',
+    'medication', 'prescription', 'treatment', 'therapy', 'diagnosis'
+)
+
+# Common words dropped from extracted medical terms
+_STOPWORDS = frozenset({'with', 'from', 'that', 'this', 'have', 'been'})
+
+# Whitespace-delimited token, as str.split() sees them
+_TOKEN_RE = re.compile(r'\S+')
+
+# Any letter; every medical pattern needs one, so text without letters cannot match
+_ALPHA_RE = re.compile(r'[^\W\d_]')
+
+def _is_word_char(char: str) -> bool:
+    """Same notion of a word character as the re module uses for word boundaries"""
+    return char.isalnum() or char == '_'
+
+# UMLS semantic types for medical concept classification, after the 127
+# semantic types covering all biomedical domains
+_SEMANTIC_TYPES = {
+    # Anatomy semantic types
+    'anatomy': [
+        'Body Part, Organ, or Organ Component', 'Body System', 'Body Space or Junction',
+        'Embryonic Structure', 'Anatomical Abnormality', 'Congenital Abnormality'
+    ],
+
+    # Physiology semantic types  
+    'physiology': [
+        'Physiologic Function', 'Pathologic Function', 'Mental Process',
+        'Organism Function', 'Organ or Tissue Function', 'Cell Function',
+        'Molecular Function', 'Genetic Function'
+    ],
+
+    # Disorders semantic types
+    'disorders': [
+        'Disease or Syndrome', 'Mental or Behavioral Dysfunction',
+        'Neoplastic Process', 'Injury or Poisoning', 'Pathologic Function',
+        'Congenital Abnormality', 'Acquired Abnormality'
+    ],
+
+    # Procedures semantic types
+    'procedures': [
+        'Therapeutic or Preventive Procedure', 'Diagnostic Procedure',
+        'Laboratory Procedure', 'Research Activity', 'Health Care Activity',
+        'Machine Activity', 'Educational Activity'
+    ],
+
+    # Chemicals and drugs semantic types
+    'substances': [
+        'Pharmacologic Substance', 'Antibiotic', 'Hormone',
+        'Enzyme', 'Vitamin', 'Immunologic Factor', 'Indicator, Reagent, or Diagnostic Aid',
+        'Hazardous or Poisonous Substance', 'Biomedical or Dental Material'
+    ],
+
+    # Organizations and occupations
+    'organizations': [
+        'Health Care Related Organization', 'Professional or Occupational Group',
+        'Population Group', 'Family Group', 'Age Group'
+    ]
+}
+
+# Medical patterns derived from UMLS concept names (SNOMED CT, RxNorm, CPT),
+# designed to capture medical terminology with high precision
+_UMLS_PATTERNS = {
+    # Disease and disorder patterns (based on SNOMED CT clinical findings)
+    'diseases_disorders': [
+        r'\b(?:acute|chronic|severe|mild|moderate|progressive|recurrent)\s+(?:\w+\s+)?(?:disease|disorder|syndrome|condition|dysfunction)\b',
+        r'\b(?:primary|secondary|metastatic|advanced|early-stage|late-stage)\s+(?:\w+\s+)?(?:cancer|carcinoma|sarcoma|lymphoma|leukemia|melanoma)\b',
+        r'\b(?:congestive\s+heart\s+failure|myocardial\s+infarction|coronary\s+artery\s+disease|atrial\s+fibrillation)\b',
+        r'\b(?:diabetes\s+mellitus|diabetic\s+ketoacidosis|hypoglycemia|hyperglycemia)\b',
+        r'\b(?:hypertension|hypotension|shock|sepsis|pneumonia|bronchitis|asthma)\b',
+        r'\b(?:osteoarthritis|rheumatoid\s+arthritis|osteoporosis|fracture)\b',
+        r'\b(?:depression|anxiety|bipolar|schizophrenia|dementia|alzheimer)\b'
+    ],
+
+    # Anatomical structure patterns (SNOMED CT body structure hierarchy)
+    'anatomical_structures': [
+        r'\b(?:cardiovascular|pulmonary|respiratory|gastrointestinal|genitourinary|musculoskeletal|neurological|dermatological)\s+(?:system|structure|anatomy)\b',
+        r'\b(?:left|right|bilateral|anterior|posterior|superior|inferior|medial|lateral|proximal|distal)\s+(?:\w+\s+)?(?:ventricle|atrium|lobe|hemisphere|quadrant)\b',
+        r'\b(?:aortic|mitral|tricuspid|pulmonary)\s+valve\b',
+        r'\b(?:coronary|carotid|renal|hepatic|pulmonary|cerebral)\s+(?:artery|arteries|vein|veins)\b',
+        r'\b(?:frontal|parietal|temporal|occipital)\s+lobe\b',
+        r'\b(?:cervical|thoracic|lumbar|sacral)\s+(?:spine|vertebrae|disc)\b'
+    ],
+
+    # Medication and substance patterns (RxNorm and FDA Orange Book)
+    'medications_substances': [
+        r'\b(?:\w+)(?:cillin|mycin|oxacin|prazole|statin|dipine|sartan|olol|pril|tide)\b',
+        r'\b(?:insulin|metformin|warfarin|heparin|aspirin|acetaminophen|ibuprofen|morphine|codeine)\b',
+        r'\b\d+\s*(?:mg|mcg|g|ml|units|iu)\s*(?:tablet|capsule|injection|solution|suspension|cream|ointment)\b',
+        r'\b(?:oral|IV|IM|SQ|topical|inhalation|sublingual|rectal|vaginal)\s+(?:administration|route|delivery)\b',
+        r'\b(?:once|twice|three\s+times|four\s+times)\s+(?:daily|weekly|monthly|yearly)\b',
+        r'\b(?:before|after|with)\s+meals\b|\bat\s+bedtime\b|\bas\s+needed\b|\bPRN\b'
+    ],
+
+    # Diagnostic and therapeutic procedures (CPT codes and SNOMED CT procedures)
+    'procedures_interventions': [
+        r'\b(?:cardiac|coronary)\s+(?:catheterization|angioplasty|bypass|stent)\b',
+        r'\b(?:computed\s+tomography|magnetic\s+resonance|ultrasound|x-ray|mammography)\s+(?:scan|imaging|examination)\b',
+        r'\b(?:colonoscopy|endoscopy|bronchoscopy|arthroscopy|laparoscopy|thoracoscopy)\b',
+        r'\b(?:biopsy|excision|resection|reconstruction|repair|replacement)\b',
+        r'\b(?:blood\s+transfusion|dialysis|chemotherapy|radiation\s+therapy|immunotherapy)\b',
+        r'\b(?:appendectomy|cholecystectomy|hysterectomy|prostatectomy|mastectomy)\b'
+    ]
+}
+
+# Each category's patterns fused into one alternation, one pass per category.
+# Categories are scanned separately so a phrase matching several categories
+# (e.g. "coronary artery disease") still counts once in each. The case flag
+# is inlined so the same source compiles under RE2 as well.
+_CATEGORY_RES = [
+    (category, (re2 if HAS_RE2 else re).compile('(?i)' + '|'.join(f'(?:{pattern})' for pattern in patterns)))
+    for category, patterns in _UMLS_PATTERNS.items()
+]
+
+# Term extraction patterns
+# Multi-word phrase patterns overlap one another ("femur bone fracture" yields
+# both "femur bone" and "bone fracture"), so each keeps its own pass
+_MULTI_WORD_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'\b[A-Z][a-z]+\s+[a-z]+\s+(?:disease|disorder|syndrome|condition)\b',
+    r'\b[A-Z][a-z]+\s+(?:artery|vein|nerve|muscle|bone)\b',
+    r'\b(?:acute|chronic|severe)\s+[a-z]+(?:\s+[a-z]+)?\b',
+    r'\b[a-z]+\s+(?:infection|inflammation|injury|fracture)\b'
+])
+_MEDICAL_WORD_RE = re.compile(r'\b(?:' + '|'.join(MEDICAL_WORDS) + r')\b', re.IGNORECASE)
+
+# One automaton pass finds every vocabulary word; word boundaries are checked per hit
+_MEDICAL_WORD_AUTOMATON = None
+if HAS_AHOCORASICK:
+    _MEDICAL_WORD_AUTOMATON = ahocorasick.Automaton()
+    for _word in MEDICAL_WORDS:
+        _MEDICAL_WORD_AUTOMATON.add_word(_word, _word)
+    _MEDICAL_WORD_AUTOMATON.make_automaton()
+    del _word
+
 class UMLSVocabularySystem:
     """
     Comprehensive UMLS vocabulary system with API integration
@@ -51,15 +195,22 @@ class UMLSVocabularySystem:
         self.session_ticket = None
         self.ticket_expiry = None
         
-        # Medical semantic types from UMLS
-        self.semantic_types = self._initialize_semantic_types()
-        
-        # Enhanced medical patterns based on UMLS structure
-        self.medical_patterns = self._create_umls_patterns()
+        # Semantic types, patterns and their compiled forms are built once at import
+        self.semantic_types = _SEMANTIC_TYPES
+        self.medical_patterns = _UMLS_PATTERNS
+        self._category_res = _CATEGORY_RES
+        self._multi_word_res = _MULTI_WORD_RES
+        self._medical_word_re = _MEDICAL_WORD_RE
+        self._medical_word_automaton = _MEDICAL_WORD_AUTOMATON
         
         # Concept cache for performance
         self._concept_cache = {}
         
+        # LRU of context analyses keyed by a 16-byte BLAKE2b digest of the text,
+        # so repeated documents skip the scan without holding large keys
+        self._context_cache: OrderedDict = OrderedDict()
+        self._context_cache_lock = threading.Lock()
+        
         logger.info("UMLS Vocabulary System initialized")
     
     def _load_umls_credentials(self) -> Optional[str]:
@@ -76,108 +227,16 @@ class UMLSVocabularySystem:
             logger.warning("UMLS API key not found. Set UMLS_API_KEY environment variable for full functionality.")
         return api_key
     
-    def _initialize_semantic_types(self) -> Dict[str, List[str]]:
-        """
-        Initialize UMLS semantic types for medical concept classification
-        
-        Based on the 127 semantic types in UMLS covering all biomedical domains
-        """
-        return {
-            # Anatomy semantic types
-            'anatomy': [
-                'Body Part, Organ, or Organ Component', 'Body System', 'Body Space or Junction',
-                'Embryonic Structure', 'Anatomical Abnormality', 'Congenital Abnormality'
-            ],
-            
-            # Physiology semantic types  
-            'physiology': [
-                'Physiologic Function', 'Pathologic Function', 'Mental Process',
-                'Organism Function', 'Organ or Tissue Function', 'Cell Function',
-                'Molecular Function', 'Genetic Function'
-            ],
-            
-            # Disorders semantic types
-            'disorders': [
-                'Disease or Syndrome', 'Mental or Behavioral Dysfunction',
-                'Neoplastic Process', 'Injury or Poisoning', 'Pathologic Function',
-                'Congenital Abnormality', 'Acquired Abnormality'
-            ],
-            
-            # Procedures semantic types
-            'procedures': [
-                'Therapeutic or Preventive Procedure', 'Diagnostic Procedure',
-                'Laboratory Procedure', 'Research Activity', 'Health Care Activity',
-                'Machine Activity', 'Educational Activity'
-            ],
-            
-            # Chemicals and drugs semantic types
-            'substances': [
-                'Pharmacologic Substance', 'Antibiotic', 'Hormone',
-                'Enzyme', 'Vitamin', 'Immunologic Factor', 'Indicator, Reagent, or Diagnostic Aid',
-                'Hazardous or Poisonous Substance', 'Biomedical or Dental Material'
-            ],
-            
-            # Organizations and occupations
-            'organizations': [
-                'Health Care Related Organization', 'Professional or Occupational Group',
-                'Population Group', 'Family Group', 'Age Group'
-            ]
-        }
-    
-    def _create_umls_patterns(self) -> Dict[str, List[str]]:
-        """
-        Create comprehensive medical patterns based on UMLS concept structure
-        
-        These patterns are derived from analysis of UMLS concept names and
-        are designed to capture medical terminology with high precision.
-        """
-        return {
-            # Disease and disorder patterns (based on SNOMED CT clinical findings)
-            'diseases_disorders': [
-                r'\b(?:acute|chronic|severe|mild|moderate|progressive|recurrent)\s+(?:\w+\s+)?(?:disease|disorder|syndrome|condition|dysfunction)\b',
-                r'\b(?:primary|secondary|metastatic|advanced|early-stage|late-stage)\s+(?:\w+\s+)?(?:cancer|carcinoma|sarcoma|lymphoma|leukemia|melanoma)\b',
-                r'\b(?:congestive\s+heart\s+failure|myocardial\s+infarction|coronary\s+artery\s+disease|atrial\s+fibrillation)\b',
-                r'\b(?:diabetes\s+mellitus|diabetic\s+ketoacidosis|hypoglycemia|hyperglycemia)\b',
-                r'\b(?:hypertension|hypotension|shock|sepsis|pneumonia|bronchitis|asthma)\b',
-                r'\b(?:osteoarthritis|rheumatoid\s+arthritis|osteoporosis|fracture)\b',
-                r'\b(?:depression|anxiety|bipolar|schizophrenia|dementia|alzheimer)\b'
-            ],
-            
-            # Anatomical structure patterns (SNOMED CT body structure hierarchy)
-            'anatomical_structures': [
-                r'\b(?:cardiovascular|pulmonary|respiratory|gastrointestinal|genitourinary|musculoskeletal|neurological|dermatological)\s+(?:system|structure|anatomy)\b',
-                r'\b(?:left|right|bilateral|anterior|posterior|superior|inferior|medial|lateral|proximal|distal)\s+(?:\w+\s+)?(?:ventricle|atrium|lobe|hemisphere|quadrant)\b',
-                r'\b(?:aortic|mitral|tricuspid|pulmonary)\s+valve\b',
-                r'\b(?:coronary|carotid|renal|hepatic|pulmonary|cerebral)\s+(?:artery|arteries|vein|veins)\b',
-                r'\b(?:frontal|parietal|temporal|occipital)\s+lobe\b',
-                r'\b(?:cervical|thoracic|lumbar|sacral)\s+(?:spine|vertebrae|disc)\b'
-            ],
-            
-            # Medication and substance patterns (RxNorm and FDA Orange Book)
-            'medications_substances': [
-                r'\b(?:\w+)(?:cillin|mycin|oxacin|prazole|statin|dipine|sartan|olol|pril|tide)\b',
-                r'\b(?:insulin|metformin|warfarin|heparin|aspirin|acetaminophen|ibuprofen|morphine|codeine)\b',
-                r'\b\d+\s*(?:mg|mcg|g|ml|units|iu)\s*(?:tablet|capsule|injection|solution|suspension|cream|ointment)\b',
-                r'\b(?:oral|IV|IM|SQ|topical|inhalation|sublingual|rectal|vaginal)\s+(?:administration|route|delivery)\b',
-                r'\b(?:once|twice|three\s+times|four\s+times)\s+(?:daily|weekly|monthly|yearly)\b',
-                r'\b(?:before|after|with)\s+meals\b|\bat\s+bedtime\b|\bas\s+needed\b|\bPRN\b'
-            ],
-            
-            # Diagnostic and therapeutic procedures (CPT codes and SNOMED CT procedures)
-            'procedures_interventions': [
-                r'\b(?:cardiac|coronary)\s+(?:catheterization|angioplasty|bypass|stent)\b',
-                r'\b(?:computed\s+tomography|magnetic\s+resonance|ultrasound|x-ray|mammography)\s+(?:scan|imaging|examination)\b',
-                r'\b(?:colonoscopy|endoscopy|bronchoscopy|arthroscopy|laparoscopy|thoracoscopy)\b',
-                r'\b(?:biopsy|excision|resection|reconstruction|repair|replacement)\b',
-                r'\b(?:blood\s+transfusion|dialysis|chemotherapy|radiation\s+therapy|immunotherapy)\b',
-                r'\b(?:appendectomy|cholecystectomy|hysterectomy|prostatectomy|mastectomy)\b'
-            ]
-        }
-    
     def analyze_medical_context(self, text: str) -> Dict[str, Any]:
         """
         Comprehensive medical context analysis using UMLS concepts
         
+        concept_count counts the non-overlapping matches of each category's
+        fused pattern. Text matched by two patterns of the same category counts
+        once ("Mild hypertension disease" is one concept, not two), which also
+        lowers concept_coverage and the context score for such text. Matches in
+        different categories are counted separately.
+        
         Args:
             text (str): Input text to analyze
             
@@ -185,47 +244,76 @@ class UMLSVocabularySystem:
             Dict[str, Any]: Detailed medical context analysis
         """
         start_time = time.time()
+        if not text or not _ALPHA_RE.search(text):
+            return {
+                'medical_terms_extracted': [],
+                'concept_count': 0,
+                'semantic_types': [],
+                'medical_term_density': 0.0,
+                'concept_coverage': 0.0,
+                'medical_context_score': 0.0,
+                'is_medical_content': False,
+                'processing_time': 0.0,
+                'umls_api_available': self.api_key is not None
+            }
+        
+        key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        
+        with self._context_cache_lock:
+            cached = self._context_cache.get(key)
+            if cached is not None:
+                self._context_cache.move_to_end(key)
+        
+        if cached is None:
+            cached = self._analyze_medical_context_uncached(text)
+            with self._context_cache_lock:
+                self._context_cache[key] = cached
+                if len(self._context_cache) > CONTEXT_CACHE_SIZE:
+                    self._context_cache.popitem(last=False)
         
+        # Hand out copies so callers cannot mutate the cached lists
+        result = dict(cached)
+        result['medical_terms_extracted'] = list(cached['medical_terms_extracted'])
+        result['semantic_types'] = list(cached['semantic_types'])
+        result['processing_time'] = time.time() - start_time
+        return result
+    
+    def _analyze_medical_context_uncached(self, text: str) -> Dict[str, Any]:
+        """
+        Run the medical context scan for analyze_medical_context
+        """
         # Extract potential medical terms
         medical_terms = self._extract_medical_terms(text)
         
-        # Analyze using medical patterns
-        all_concepts = []
+        # Analyze using medical patterns; only the match count and the
+        # categories are reported, so no per-match concept records are kept
+        concept_count = 0
         semantic_types_found = set()
         
-        for category, patterns in self.medical_patterns.items():
-            for pattern in patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                if matches:
-                    for match in matches:
-                        concept = {
-                            'text': match,
-                            'category': category,
-                            'confidence': 0.8
-                        }
-                        all_concepts.append(concept)
-                        semantic_types_found.add(category)
+        for category, regex in self._category_res:
+            matches = sum(1 for _ in regex.finditer(text))
+            if matches:
+                concept_count += matches
+                semantic_types_found.add(category)
         
-        # Calculate medical relevance scores
-        medical_term_density = len(medical_terms) / max(len(text.split()), 1)
-        concept_coverage = len(all_concepts) / max(len(medical_terms), 1) if medical_terms else 0
+        # Calculate medical relevance scores; count tokens without materializing them
+        word_count = sum(1 for _ in _TOKEN_RE.finditer(text))
+        medical_term_density = len(medical_terms) / max(word_count, 1)
+        concept_coverage = concept_count / max(len(medical_terms), 1) if medical_terms else 0
         
         # Calculate overall medical context score
         context_score = self._calculate_context_score(
             medical_term_density, concept_coverage, len(semantic_types_found)
         )
         
-        processing_time = time.time() - start_time
-        
         return {
             'medical_terms_extracted': medical_terms,
-            'concept_count': len(all_concepts),
+            'concept_count': concept_count,
             'semantic_types': list(semantic_types_found),
             'medical_term_density': medical_term_density,
             'concept_coverage': concept_coverage,
             'medical_context_score': context_score,
             'is_medical_content': context_score > 0.3,
-            'processing_time': processing_time,
             'umls_api_available': self.api_key is not None
         }
     
@@ -242,31 +330,24 @@ class UMLSVocabularySystem:
         medical_terms = set()
         
         # Extract multi-word medical phrases
-        multi_word_patterns = [
-            r'\b[A-Z][a-z]+\s+[a-z]+\s+(?:disease|disorder|syndrome|condition)\b',
-            r'\b[A-Z][a-z]+\s+(?:artery|vein|nerve|muscle|bone)\b',
-            r'\b(?:acute|chronic|severe)\s+[a-z]+(?:\s+[a-z]+)?\b',
-            r'\b[a-z]+\s+(?:infection|inflammation|injury|fracture)\b'
-        ]
-        
-        for pattern in multi_word_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            medical_terms.update(match.strip().lower() for match in matches)
+        for regex in self._multi_word_res:
+            medical_terms.update(match.group().strip().lower() for match in regex.finditer(text))
         
         # Extract single medical words
-        medical_word_patterns = [
-            r'\b(?:heart|lung|liver|kidney|brain|blood|bone|muscle)\b',
-            r'\b(?:diabetes|cancer|pneumonia|infection|fracture|surgery)\b',
-            r'\b(?:medication|prescription|treatment|therapy|diagnosis)\b'
-        ]
-        
-        for pattern in medical_word_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            medical_terms.update(match.strip().lower() for match in matches)
+        if self._medical_word_automaton is not None:
+            lowered = text.lower()
+            last = len(lowered) - 1
+            for end, word in self._medical_word_automaton.iter(lowered):
+                start = end - len(word) + 1
+                if ((start == 0 or not _is_word_char(lowered[start - 1]))
+                        and (end == last or not _is_word_char(lowered[end + 1]))):
+                    medical_terms.add(word)
+        else:
+            medical_terms.update(match.group().lower() for match in self._medical_word_re.finditer(text))
         
         # Remove very short terms and common words
         filtered_terms = [term for term in medical_terms 
-                         if len(term) > 3 and term not in ['with', 'from', 'that', 'this', 'have', 'been']]
+                         if len(term) > 3 and term not in _STOPWORDS]
         
         return list(filtered_terms)
     
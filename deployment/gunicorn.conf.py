@@ -1,8 +1,18 @@
 bind = "0.0.0.0:5000"
 workers = 4
-worker_class = "sync"
+worker_class = "gthread"
+threads = 8
+# Build models and compiled patterns once in the master; workers share them copy-on-write
+preload_app = True
+worker_tmp_dir = "/dev/shm"
 timeout = 300
 max_requests = 1000
 max_requests_jitter = 100
 accesslog = "-"
 errorlog = "-"
+
+
+def pre_fork(server, worker):
+    # Flush audit records buffered in the master so workers do not inherit and rewrite them
+    from core.security import SecurityManager
+    SecurityManager.flush_audit_log()
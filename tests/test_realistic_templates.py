@@ -0,0 +1,15 @@
+import pytest
+
+from core.realistic_templates import _check_placeholders, render_template
+
+def test_render_template_composite_fields():
+    fields = {"first_name": "Jane", "last_name": "Doe", "bp_systolic": 120, "bp_diastolic": 80}
+    out = render_template("{full_name} BP {bp_string}", fields)
+    assert out == "Jane Doe BP 120/80"
+    assert "full_name" not in fields and "bp_string" not in fields
+
+def test_format_spec_placeholders_rejected():
+    with pytest.raises(ValueError):
+        _check_placeholders("BP {bp_systolic:03d}")
+    with pytest.raises(ValueError):
+        _check_placeholders("{name!r}")
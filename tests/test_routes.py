@@ -0,0 +1,143 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+import zipfile
+from collections import Counter
+
+import pytest
+from flask import Flask
+
+from core.classifier import AdvancedPHIClassifier
+from core.generator import SyntheticHealthDataGenerator
+from core.processor import DocumentProcessor
+from web import routes, web_bp
+
+@pytest.fixture
+def app(tmp_path):
+    """Bare app with the web blueprint; tests add the services they need to APP_SERVICES."""
+    app = Flask(__name__)
+    app.config["UPLOAD_FOLDER"] = str(tmp_path)
+    app.config["APP_SERVICES"] = {}
+    app.register_blueprint(web_bp)
+    return app
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+def test_app_routes_registered_once():
+    pytest.importorskip("flask_session")
+    from app import create_app
+
+    app = create_app()
+    rules = Counter(
+        (rule.rule, method)
+        for rule in app.url_map.iter_rules()
+        for method in rule.methods - {"HEAD", "OPTIONS"}
+    )
+    assert [key for key, count in rules.items() if count > 1] == []
+    assert ("/api/classify", "POST") in rules
+    assert ("/health", "GET") in rules
+
+def test_download_zip_streams_all_files(tmp_path, client):
+    generated = tmp_path / "generated"
+    generated.mkdir()
+    (generated / "a.txt").write_text("alpha " * 50000)
+    (generated / "b.pdf").write_bytes(b"%PDF beta")
+    response = client.get("/api/downloads/zip")
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert "Content-Length" not in response.headers
+    archive = zipfile.ZipFile(io.BytesIO(response.data))
+    assert archive.testzip() is None
+    assert archive.read("a.txt") == b"alpha " * 50000
+    assert archive.getinfo("a.txt").compress_type == zipfile.ZIP_DEFLATED
+    assert archive.getinfo("b.pdf").compress_type == zipfile.ZIP_STORED
+    assert archive.read("b.pdf") == b"%PDF beta"
+
+def test_classify_stream_raw_body(app, client):
+    app.config["APP_SERVICES"].update({"processor": DocumentProcessor(), "classifier": AdvancedPHIClassifier()})
+    response = client.post(
+        "/api/classify/stream?filename=note.txt",
+        data=b"Patient John Smith, SSN 123-45-6789, DOB 01/02/1970.",
+        content_type="application/octet-stream",
+    )
+    assert response.status_code == 200
+    [result] = response.get_json()["results"]
+    assert result["filename"] == "note.txt"
+    assert result["contains_phi"] is True
+
+def test_download_file_conditional_and_missing(tmp_path, client):
+    generated = tmp_path / "generated"
+    generated.mkdir()
+    (generated / "a.txt").write_text("alpha")
+    response = client.get("/api/downloads/a.txt")
+    assert response.status_code == 200 and response.data == b"alpha"
+    cached = client.get("/api/downloads/a.txt", headers={"If-None-Match": response.headers["ETag"]})
+    assert cached.status_code == 304
+    missing = client.get("/api/downloads/nope.txt")
+    assert missing.status_code == 404
+    assert missing.get_json() == {"error": "File not found"}
+
+def test_generate_async_job_polling(app, client):
+    app.config["APP_SERVICES"].update({"generator": SyntheticHealthDataGenerator()})
+    accepted = client.post("/api/generate", json={"count": 2, "formats": ["txt"], "async": True})
+    assert accepted.status_code == 202
+    poll_url = accepted.get_json()["poll_url"]
+    deadline = time.time() + 30
+    while (status := client.get(poll_url).get_json())["status"] == "running" and time.time() < deadline:
+        time.sleep(0.05)
+    assert status["status"] == "success"
+    assert status["count"] == 2
+    assert client.get("/api/generate/status/" + "0" * 32).status_code == 404
+
+def test_generate_lost_job_reported_and_stale_swept(tmp_path, app, client):
+    app.config["APP_SERVICES"].update({"generator": object()})
+    jobs = tmp_path / "jobs"
+    jobs.mkdir()
+    exited = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"], capture_output=True, text=True)
+    lost_id = "a" * 32
+    (jobs / f"{lost_id}.running.json").write_text(json.dumps(
+        {"status": "running", "job_id": lost_id, "started_at": time.time(), "pid": int(exited.stdout)}
+    ))
+    status = client.get(f"/api/generate/status/{lost_id}").get_json()
+    assert status["status"] == "error"
+    assert not (jobs / f"{lost_id}.running.json").exists()
+    stale = jobs / ("b" * 32 + ".json")
+    stale.write_text("{}")
+    os.utime(stale, (0, 0))
+    client.post("/api/generate", json={"count": 0, "async": True})
+    assert not stale.exists()
+    assert (jobs / f"{lost_id}.json").exists()
+
+def test_generation_job_saves_error_when_result_write_fails(tmp_path, monkeypatch):
+    write_job = routes._write_job
+    def failing_first_write(path, payload):
+        if payload.get("status") == "success":
+            raise OSError("disk full")
+        write_job(path, payload)
+    monkeypatch.setattr(routes, "_write_job", failing_first_write)
+    monkeypatch.setattr(routes, "_generate_documents", lambda *args: {"status": "success"})
+    (tmp_path / "jobs").mkdir()
+    routes._run_generation_job("c" * 32, None, 1, ["txt"], False, str(tmp_path))
+    result = json.loads((tmp_path / "jobs" / ("c" * 32 + ".json")).read_text())
+    assert result["status"] == "error"
+    assert result["job_id"] == "c" * 32
+
+def test_downloads_list_etag(tmp_path, client):
+    generated = tmp_path / "generated"
+    generated.mkdir()
+    (generated / "a.txt").write_text("alpha")
+    os.utime(generated, ns=(0, 10**9))
+    first = client.get("/api/downloads/list")
+    assert first.get_json()["count"] == 1
+    etag = first.headers["ETag"]
+    assert client.get("/api/downloads/list", headers={"If-None-Match": etag}).status_code == 304
+    (generated / "b.txt").write_text("beta")
+    changed = client.get("/api/downloads/list", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.get_json()["count"] == 2
+    assert "ETag" not in changed.headers
@@ -0,0 +1,98 @@
+import json
+import time
+import threading
+
+import pytest
+
+from core import security
+from core.security import SecurityManager
+
+@pytest.fixture(autouse=True)
+def secure_dirs(tmp_path, monkeypatch):
+    """Point SecurityManager's process-wide directories, keys and audit log at tmp_path."""
+    dirs = {name: tmp_path / name for name in ("uploads", "processed", "logs", "temp", "keys", "models")}
+    for path in dirs.values():
+        path.mkdir()
+    monkeypatch.setattr(SecurityManager, "_shared_directories", dirs)
+    monkeypatch.setattr(SecurityManager, "_shared_ciphers", None)
+    SecurityManager._close_audit_log()
+    yield dirs
+    SecurityManager._close_audit_log()
+
+def test_content_security_names_matching_patterns():
+    sm = SecurityManager()
+    is_safe, threats = sm.validate_content_security("note <SCRIPT>alert(1)</script>")
+    assert not is_safe
+    assert threats == ["Malicious pattern: <script[^>]*>.*?</script>"]
+    assert sm.validate_content_security("Patient seen for follow-up.") == (True, [])
+
+def test_encrypt_round_trip_without_base64():
+    sm = SecurityManager()
+    token = sm.encrypt_content("MRN 12345")
+    assert len(token) == len("MRN 12345") + 12 + 16
+    assert sm.decrypt_content(token) == "MRN 12345"
+
+def test_secure_file_storage_streams_decryptable_output():
+    sm = SecurityManager()
+    content = bytes(range(256)) * 9000  # spans several hash/encrypt chunks
+    path = sm.secure_file_storage(content, "notes.txt")
+    with open(path, "rb") as f:
+        assert sm._decrypt(f.read()) == content
+
+def test_audit_log_is_buffered_jsonl():
+    sm = SecurityManager()
+    sm.log_security_event("unit_test_event", {"marker": "audit-jsonl"})
+    SecurityManager.flush_audit_log()
+    log_file = sm.secure_directories["logs"] / "security_audit.log"
+    last = log_file.read_text(encoding="utf-8").splitlines()[-1]
+    assert json.loads(last)["event_data"] == {"marker": "audit-jsonl"}
+
+def test_audit_log_flushes_lone_record_on_timer(monkeypatch):
+    monkeypatch.setattr(security, "AUDIT_FLUSH_INTERVAL", 0.05)
+    sm = SecurityManager()
+    SecurityManager.flush_audit_log()
+    marker = f"audit-timer-{time.time_ns()}"
+    sm.log_security_event("unit_test_event", {"marker": marker})
+    log_file = sm.secure_directories["logs"] / "security_audit.log"
+    deadline = time.monotonic() + 5
+    while marker.encode() not in log_file.read_bytes():
+        assert time.monotonic() < deadline
+        time.sleep(0.02)
+    assert not SecurityManager._audit_buf
+
+def test_content_security_first_match_short_circuit():
+    sm = SecurityManager()
+    is_safe, threats = sm.validate_content_security("javascript:go() then ../x/..", report_all=False)
+    assert not is_safe
+    assert threats == ["Malicious pattern: javascript:"]
+
+def test_content_security_scans_bytes_like_text():
+    sm = SecurityManager()
+    text = "ok\n<Script src=x>\n</SCRIPT> onerror = 1"
+    assert sm.validate_content_security(text.encode()) == sm.validate_content_security(text)
+    assert sm.validate_content_security(b"\xff\xfe plain bytes") == (True, [])
+
+def test_aead_key_read_waits_for_concurrent_writer(tmp_path):
+    key_file = tmp_path / "master_aead.key"
+    key = bytes(range(32))
+    key_file.write_bytes(key[:10])
+    writer = threading.Timer(0.1, key_file.write_bytes, args=(key,))
+    writer.start()
+    assert SecurityManager._read_aead_key(key_file) == key
+    writer.join()
+
+def test_oversized_aead_key_fails_closed(secure_dirs):
+    (secure_dirs["keys"] / "master_aead.key").write_bytes(bytes(range(32)) + b"\n")
+    with pytest.raises(ValueError):
+        SecurityManager()
+
+def test_corrupt_legacy_key_keeps_aead_encryption(secure_dirs):
+    (secure_dirs["keys"] / "master.key").write_bytes(b"not a fernet key")
+    sm = SecurityManager()
+    assert sm.encryption_enabled
+    assert sm.legacy_cipher is None
+    path = sm.secure_file_storage(b"MRN 12345", "notes.txt")
+    with open(path, "rb") as f:
+        stored = f.read()
+    assert b"MRN 12345" not in stored
+    assert sm._decrypt(stored) == b"MRN 12345"
@@ -0,0 +1,33 @@
+from core.umls_integration import UMLSVocabularySystem
+
+def test_medical_context_detected():
+    umls = UMLSVocabularySystem()
+    res = umls.analyze_medical_context("Patient with acute respiratory distress syndrome and pneumonia, started on amoxicillin.")
+    assert res["is_medical_content"] is True
+    assert "respiratory distress syndrome" in res["medical_terms_extracted"]
+    assert "diseases_disorders" in res["semantic_types"]
+
+def test_letter_free_text_short_circuits():
+    umls = UMLSVocabularySystem()
+    res = umls.analyze_medical_context("12345 678-90")
+    assert res["concept_count"] == 0
+    assert res["medical_context_score"] == 0.0
+    assert res["is_medical_content"] is False
+
+def test_overlapping_categories_all_counted():
+    umls = UMLSVocabularySystem()
+    res = umls.analyze_medical_context("Patient has coronary artery disease and a left femur bone fracture.")
+    assert res["concept_count"] == 3
+    assert "diseases_disorders" in res["semantic_types"]
+    assert "anatomical_structures" in res["semantic_types"]
+
+def test_same_category_overlap_counted_once():
+    umls = UMLSVocabularySystem()
+    res = umls.analyze_medical_context("Mild hypertension disease on lisinopril twice daily")
+    assert res["concept_count"] == 3
+    assert sorted(res["semantic_types"]) == ["diseases_disorders", "medications_substances"]
+
+def test_overlapping_multi_word_terms_extracted():
+    umls = UMLSVocabularySystem()
+    terms = umls.analyze_medical_context("Femoral artery infection noted, left femur bone fracture.")["medical_terms_extracted"]
+    assert {"femoral artery", "artery infection", "femur bone", "bone fracture"} <= set(terms)
@@ -4,19 +4,63 @@ Flask Routes Module
 Web interface and REST API endpoints for PHI classification system.
 """
 
+import os
 import json
 import logging
 import zipfile
-import io
+import time
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
-from flask import render_template, request, jsonify, current_app, send_file, send_from_directory
+from werkzeug.datastructures import FileStorage
+from werkzeug.exceptions import NotFound
+from flask import render_template, request, jsonify, current_app, send_from_directory
 from . import web_bp
 from .auth import require_api_key
 
+# Optional orjson for faster response serialization
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+# Classification reported for files with no extractable text; read-only, shared across requests
+_EMPTY_CLASSIFICATION = {"contains_phi": False, "confidence": 0.0, "risk_level": "NONE", "total_phi_identifiers": 0}
+
+# Threads in the per-app pool shared by all multi-file classification requests
+CLASSIFY_MAX_WORKERS = 8
+
+# Threads running background generation jobs ({"async": true} on /api/generate)
+GENERATE_MAX_WORKERS = 2
+
+# A "running" job older than this, or whose worker process is gone, is reported as failed
+JOB_MAX_RUNTIME = 60 * 60
+
+# Job status files (finished or abandoned) are removed this long after their last write
+JOB_RETENTION = 24 * 60 * 60
+
+# Guards lazy creation of the per-app thread pools
+_pool_lock = threading.Lock()
+
+# Raw-body uploads to /api/classify/stream are read in chunks of this size and
+# kept in memory up to STREAM_SPOOL_SIZE before spilling to a temporary file
+STREAM_READ_SIZE = 1 << 20
+STREAM_SPOOL_SIZE = 16 << 20
+
+# Bytes read per step while streaming a file into the downloads ZIP
+ZIP_READ_SIZE = 64 << 10
+
+# Text formats worth deflating; PDF and DOCX are already compressed containers and are stored
+ZIP_DEFLATE_SUFFIXES = frozenset({".txt", ".json", ".csv", ".xml"})
+
 @web_bp.route("/")
 def index():
     """Main landing page with system overview."""
@@ -37,61 +81,286 @@ def downloads_page():
     """Downloads page for viewing and downloading generated files."""
     return render_template("downloads.html")
 
+# (epoch second, ISO string) for _now_iso; replaced as a whole so readers never see a torn pair
+_ts_cache = (0, "")
+
+def _now_iso():
+    """Local ISO-8601 timestamp at second resolution, formatted at most once per second."""
+    global _ts_cache
+    now = int(time.time())
+    cached_at, formatted = _ts_cache
+    if now != cached_at:
+        formatted = datetime.fromtimestamp(now).isoformat()
+        _ts_cache = (now, formatted)
+    return formatted
+
+# Strips the date and time separators from an ISO timestamp for use in filenames
+_FILENAME_TS_TRANS = str.maketrans("", "", "-:")
+
+def _fast_write(path, content):
+    """Write bytes, or str as UTF-8, to path with one open and no Python file object."""
+    data = memoryview(content if isinstance(content, bytes) else content.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+def _jsonify(obj, status=200):
+    """jsonify() replacement that serializes with orjson when it is installed."""
+    if HAS_ORJSON:
+        body = orjson.dumps(obj, default=current_app.json.default, option=orjson.OPT_SERIALIZE_NUMPY)
+        return current_app.response_class(body, status=status, mimetype="application/json")
+    response = jsonify(obj)
+    response.status_code = status
+    return response
+
+def _app_services():
+    """Services wired by create_app, resolving the current_app proxy only once."""
+    app = current_app._get_current_object()
+    services = app.extensions.get("app_services")
+    if services is None:
+        services = app.config.get("APP_SERVICES", {})
+    return services
+
+def _app_pool(name, max_workers):
+    """Per-app thread pool stored as app.extensions[name+"_pool"], created on first use."""
+    app = current_app._get_current_object()
+    key = f"{name}_pool"
+    pool = app.extensions.get(key)
+    if pool is None:
+        with _pool_lock:
+            pool = app.extensions.get(key)
+            if pool is None:
+                pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+                app.extensions[key] = pool
+    return pool
+
+def _classify_one(file, process_document, classify_document):
+    """Extract text from one uploaded file and classify it for PHI."""
+    try:
+        # Process document to extract text
+        doc_result = process_document(file, file.filename)
+        text = doc_result.get("text", "") if doc_result.get("success") else ""
+        
+        # Classify for PHI
+        classification = classify_document(text) if classify_document and text else _EMPTY_CLASSIFICATION
+        
+        return {
+            "filename": doc_result.get("filename", file.filename),
+            "contains_phi": bool(classification.get("contains_phi", False)),
+            "confidence": float(classification.get("confidence", 0.0)),
+            "risk_level": classification.get("risk_level", "NONE"),
+            "total_identifiers": int(classification.get("total_phi_identifiers", 0)),
+            "file_size": doc_result.get("file_size", 0),
+            "word_count": doc_result.get("word_count", 0)
+        }
+    except Exception as e:
+        logger.error(f"Error processing file {file.filename}: {e}")
+        return {
+            "filename": file.filename,
+            "error": str(e),
+            "contains_phi": False,
+            "confidence": 0.0,
+            "risk_level": "ERROR"
+        }
+
 @web_bp.route("/api/classify", methods=["POST"])
 @require_api_key
 def api_classify():
     """REST API endpoint for document classification."""
     files = request.files.getlist("files")
     if not files:
-        return jsonify({"status": "error", "message": "No files uploaded"}), 400
+        return _jsonify({"status": "error", "message": "No files uploaded"}, 400)
     
-    # Get services from app config
-    services = current_app.config.get("APP_SERVICES", {})
+    # Get services wired by create_app
+    services = _app_services()
     processor = services.get("processor")
     classifier = services.get("classifier")
     
     if not processor:
-        return jsonify({"status":"error","message":"Processor unavailable"}), 503
+        return _jsonify({"status":"error","message":"Processor unavailable"}, 503)
     
-    results = []
-    for file in files:
-        try:
-            # Process document to extract text
-            doc_result = processor.process_document(file, file.filename)
-            text = doc_result.get("text", "") if doc_result.get("success") else ""
-            
-            # Classify for PHI
-            classification = {"contains_phi": False, "confidence": 0.0, "risk_level": "NONE", "total_phi_identifiers": 0}
-            if classifier and text:
-                classification = classifier.classify_document(text)
-            
-            results.append({
-                "filename": doc_result.get("filename", file.filename),
-                "contains_phi": bool(classification.get("contains_phi", False)),
-                "confidence": float(classification.get("confidence", 0.0)),
-                "risk_level": classification.get("risk_level", "NONE"),
-                "total_identifiers": int(classification.get("total_phi_identifiers", 0)),
-                "file_size": doc_result.get("file_size", 0),
-                "word_count": doc_result.get("word_count", 0)
-            })
-        except Exception as e:
-            logger.error(f"Error processing file {file.filename}: {e}")
-            results.append({
-                "filename": file.filename,
-                "error": str(e),
-                "contains_phi": False,
-                "confidence": 0.0,
-                "risk_level": "ERROR"
-            })
+    classify_one = partial(
+        _classify_one,
+        process_document=processor.process_document,
+        classify_document=classifier.classify_document if classifier else None
+    )
+    
+    # Overlap parsing and classification across uploads; map() keeps input order
+    if len(files) == 1:
+        results = [classify_one(files[0])]
+    else:
+        results = list(_app_pool("classify", CLASSIFY_MAX_WORKERS).map(classify_one, files))
     
-    return jsonify({
+    return _jsonify({
         "status": "success",
         "results": results,
         "total_files": len(files),
-        "successful_classifications": len([r for r in results if "error" not in r]),
-        "timestamp": datetime.now().isoformat()
+        "successful_classifications": sum("error" not in r for r in results),
+        "timestamp": _now_iso()
     })
 
+@web_bp.route("/api/classify/stream", methods=["POST"])
+@require_api_key
+def api_classify_stream():
+    """REST API endpoint classifying one document sent as the raw request body."""
+    filename = request.args.get("filename") or request.headers.get("X-Filename") or "upload.txt"
+    
+    services = _app_services()
+    processor = services.get("processor")
+    classifier = services.get("classifier")
+    
+    if not processor:
+        return _jsonify({"status":"error","message":"Processor unavailable"}, 503)
+    
+    # Copy the body without the multipart parser; large uploads spill to disk
+    with tempfile.SpooledTemporaryFile(max_size=STREAM_SPOOL_SIZE) as spool:
+        reader = request.stream
+        while chunk := reader.read(STREAM_READ_SIZE):
+            spool.write(chunk)
+        spool.seek(0)
+        
+        result = _classify_one(
+            FileStorage(stream=spool, filename=filename),
+            process_document=processor.process_document,
+            classify_document=classifier.classify_document if classifier else None
+        )
+    
+    return _jsonify({
+        "status": "success",
+        "results": [result],
+        "total_files": 1,
+        "successful_classifications": 0 if "error" in result else 1,
+        "timestamp": _now_iso()
+    })
+
+def _generate_documents(generator, count, formats, save_to_disk, output_dir):
+    """Generate documents, optionally save them under output_dir, and build the response payload."""
+    # Generate documents
+    docs = generator.generate_synthetic_documents(count=count, formats=formats)
+
+    # Save documents to disk if requested
+    saved_files = []
+    # One URL per document, formatted once and shared by both listings
+    download_urls = []
+
+    if save_to_disk:
+        output_path = Path(output_dir) / "generated"
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        for doc in docs:
+            filename = doc.get("filename", f"synthetic_{doc.get('document_id')}.txt")
+            file_path = output_path / filename
+            download_url = f"/downloads/{filename}"
+            download_urls.append(download_url)
+
+            # Write content to file (binary formats as-is, text as UTF-8)
+            _fast_write(file_path, doc.get("content", ""))
+
+            saved_files.append({
+                "filename": filename,
+                "path": str(file_path),
+                "size_bytes": doc.get("file_size_bytes", 0),
+                "download_url": download_url
+            })
+        # Overwriting files in place leaves the directory mtime alone; bump it so every
+        # worker's listing cache and the listing ETag see the new batch
+        os.utime(output_path)
+        logger.info(f"Saved {len(saved_files)} generated documents to {output_path}")
+    else:
+        download_urls = [None] * len(docs)
+
+    return {
+        "status": "success",
+        "count": len(docs),
+        "saved_to_disk": save_to_disk,
+        "output_directory": str(output_path) if save_to_disk else None,
+        "saved_files": saved_files if save_to_disk else [],
+        "download_all_url": "/api/downloads/zip" if save_to_disk and saved_files else None,
+        "list_files_url": "/api/downloads/list",
+        "documents": [
+            {
+                "id": doc.get("document_id"),
+                "type": doc.get("document_type"),
+                "format": doc.get("format"),
+                "filename": doc.get("filename"),
+                "contains_phi": doc.get("contains_phi", True),
+                "phi_density": doc.get("phi_density", 0),
+                "file_size_bytes": doc.get("file_size_bytes", 0),
+                "medical_complexity": doc.get("medical_complexity", "unknown"),
+                "created_date": doc.get("created_date"),
+                "download_url": download_url
+            }
+            for doc, download_url in zip(docs, download_urls)
+        ],
+        "timestamp": _now_iso()
+    }
+
+def _job_path(output_dir, job_id, running=False):
+    """Result file of a background generation job, or with running=True its small
+    in-progress record; both are shared by all workers on the host."""
+    return Path(output_dir) / "jobs" / (f"{job_id}.running.json" if running else f"{job_id}.json")
+
+def _write_job(job_path, payload):
+    """Atomically replace a job's status file so pollers never read a partial write."""
+    if HAS_ORJSON:
+        body = orjson.dumps(payload, default=str, option=orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        body = json.dumps(payload, default=str)
+    tmp_path = job_path.with_suffix(".tmp")
+    _fast_write(tmp_path, body)
+    os.replace(tmp_path, job_path)
+
+def _job_lost(job):
+    """Whether a "running" job can no longer finish: its worker exited or it ran too long."""
+    if time.time() - job.get("started_at", 0) > JOB_MAX_RUNTIME:
+        return True
+    try:
+        os.kill(job["pid"], 0)
+    except ProcessLookupError:
+        return True
+    except (KeyError, TypeError, PermissionError):
+        pass
+    return False
+
+def _sweep_jobs(jobs_dir):
+    """Remove job status files not written for JOB_RETENTION seconds."""
+    cutoff = time.time() - JOB_RETENTION
+    try:
+        with os.scandir(jobs_dir) as it:
+            for entry in it:
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except FileNotFoundError:
+                    pass
+    except FileNotFoundError:
+        pass
+
+def _run_generation_job(job_id, generator, count, formats, save_to_disk, output_dir):
+    """Background body of an async /api/generate request."""
+    try:
+        payload = _generate_documents(generator, count, formats, save_to_disk, output_dir)
+    except Exception as e:
+        logger.error(f"Generation job {job_id} failed: {e}")
+        payload = {"status": "error", "message": str(e)}
+    payload["job_id"] = job_id
+    # Exceptions here would vanish into the pool's future, so log them and fall back
+    # to a small error record; the running record is dropped only once a result exists
+    result_path = _job_path(output_dir, job_id)
+    try:
+        _write_job(result_path, payload)
+    except Exception:
+        logger.exception(f"Generation job {job_id} could not save its result")
+        try:
+            _write_job(result_path, {"status": "error", "message": "Job result could not be saved", "job_id": job_id})
+        except Exception:
+            logger.exception(f"Generation job {job_id} could not save an error record")
+            return
+    _job_path(output_dir, job_id, running=True).unlink(missing_ok=True)
+
 @web_bp.route("/api/generate", methods=["POST"])
 @require_api_key
 def api_generate():
@@ -101,87 +370,87 @@ def api_generate():
     formats = data.get("formats", ["txt"])
     
     # Get generator service
-    services = current_app.config.get("APP_SERVICES", {})
+    services = _app_services()
     generator = services.get("generator")
     
     if not generator:
-        return jsonify({"status":"error","message":"Generator unavailable"}), 503
+        return _jsonify({"status":"error","message":"Generator unavailable"}, 503)
     
-    try:
-        # Generate documents
-        docs = generator.generate_synthetic_documents(count=count, formats=formats)
-
-        # Save documents to disk if requested
-        save_to_disk = data.get("save_to_disk", True)  # Default to True for user convenience
-        output_dir = current_app.config.get("UPLOAD_FOLDER")
-        saved_files = []
-
-        if save_to_disk:
-            from pathlib import Path
-            output_path = Path(output_dir) / "generated"
-            output_path.mkdir(parents=True, exist_ok=True)
-
-            for doc in docs:
-                filename = doc.get("filename", f"synthetic_{doc.get('document_id')}.txt")
-                file_path = output_path / filename
-
-                # Write content to file (handle both text and binary formats)
-                content = doc.get("content", "")
-
-                # Check if content is binary (bytes) or text (str)
-                if isinstance(content, bytes):
-                    # Binary format (PDF, DOCX)
-                    with open(file_path, 'wb') as f:
-                        f.write(content)
-                else:
-                    # Text format (TXT, JSON, CSV, XML)
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
-
-                saved_files.append({
-                    "filename": filename,
-                    "path": str(file_path),
-                    "size_bytes": doc.get("file_size_bytes", 0),
-                    "download_url": f"/downloads/{filename}"
-                })
-                logger.info(f"Saved generated document to {file_path}")
-
-        return jsonify({
-            "status": "success",
-            "count": len(docs),
-            "saved_to_disk": save_to_disk,
-            "output_directory": str(output_path) if save_to_disk else None,
-            "saved_files": saved_files if save_to_disk else [],
-            "download_all_url": "/api/downloads/zip" if save_to_disk and saved_files else None,
-            "list_files_url": "/api/downloads/list",
-            "documents": [
-                {
-                    "id": doc.get("document_id"),
-                    "type": doc.get("document_type"),
-                    "format": doc.get("format"),
-                    "filename": doc.get("filename"),
-                    "contains_phi": doc.get("contains_phi", True),
-                    "phi_density": doc.get("phi_density", 0),
-                    "file_size_bytes": doc.get("file_size_bytes", 0),
-                    "medical_complexity": doc.get("medical_complexity", "unknown"),
-                    "created_date": doc.get("created_date"),
-                    "download_url": f"/downloads/{doc.get('filename')}" if save_to_disk else None
-                }
-                for doc in docs
-            ],
-            "timestamp": datetime.now().isoformat()
+    save_to_disk = data.get("save_to_disk", True)  # Default to True for user convenience
+    output_dir = current_app.config.get("UPLOAD_FOLDER")
+    
+    # Large batches can run in the background; the job's result is polled from a status route
+    if data.get("async"):
+        job_id = uuid.uuid4().hex
+        running_path = _job_path(output_dir, job_id, running=True)
+        running_path.parent.mkdir(parents=True, exist_ok=True)
+        _sweep_jobs(running_path.parent)
+        _write_job(running_path, {
+            "status": "running",
+            "job_id": job_id,
+            "timestamp": _now_iso(),
+            "started_at": time.time(),
+            "pid": os.getpid()
         })
+        _app_pool("generate", GENERATE_MAX_WORKERS).submit(
+            _run_generation_job, job_id, generator, count, formats, save_to_disk, output_dir
+        )
+        return _jsonify({
+            "status": "accepted",
+            "job_id": job_id,
+            "poll_url": f"/api/generate/status/{job_id}",
+            "timestamp": _now_iso()
+        }, 202)
+    
+    try:
+        return _jsonify(_generate_documents(generator, count, formats, save_to_disk, output_dir))
     except Exception as e:
         logger.error(f"Generation error: {e}")
-        return jsonify({"status":"error","message":str(e)}), 500
+        return _jsonify({"status":"error","message":str(e)}, 500)
+
+@web_bp.route("/api/generate/status/<job_id>")
+@require_api_key
+def api_generate_status(job_id):
+    """Status, and once finished the full result, of a background generation job."""
+    # Job ids are uuid4 hex; anything else cannot name a job file
+    if len(job_id) != 32 or not all(c in "0123456789abcdef" for c in job_id):
+        return _jsonify({"status": "error", "message": "Unknown job"}, 404)
+    output_dir = current_app.config.get("UPLOAD_FOLDER")
+    # The running record is removed only after the result is written, so checking it
+    # first never misses a job that finishes between the two reads
+    running_path = _job_path(output_dir, job_id, running=True)
+    try:
+        with open(running_path, "rb") as f:
+            job = json.loads(f.read())
+    except FileNotFoundError:
+        job = None
+    if job is not None:
+        if not _job_lost(job):
+            return _jsonify(job)
+        failed = {
+            "status": "error",
+            "message": "Job was interrupted before finishing",
+            "job_id": job_id,
+            "timestamp": _now_iso()
+        }
+        _write_job(_job_path(output_dir, job_id), failed)
+        running_path.unlink(missing_ok=True)
+        return _jsonify(failed)
+    try:
+        with open(_job_path(output_dir, job_id), "rb") as f:
+            body = f.read()
+    except FileNotFoundError:
+        return _jsonify({"status": "error", "message": "Unknown job"}, 404)
+    # Finished results are served as stored, without re-serializing them
+    return current_app.response_class(body, mimetype="application/json")
 
 @web_bp.route("/api/status")
 def api_status():
     """REST API endpoint for system status."""
-    services = current_app.config.get("APP_SERVICES", {})
+    services = _app_services()
     
-    return jsonify({
-        "timestamp": datetime.now().isoformat(),
+    return _jsonify({
+        "timestamp": _now_iso(),
         "status": "operational",
         "version": "1.0.0",
         "services": {
@@ -191,47 +460,88 @@ def api_status():
         }
     })
 
+# (ISO timestamp, encoded body) for /health; rebuilt only when the second changes
+_health_cache = ("", b"")
+
 @web_bp.route("/health")
 def health_check():
     """Health check endpoint for load balancers."""
-    return jsonify({
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat()
-    })
+    global _health_cache
+    timestamp = _now_iso()
+    cached_at, body = _health_cache
+    if timestamp != cached_at:
+        body = json.dumps({"status": "healthy", "timestamp": timestamp}).encode("utf-8")
+        _health_cache = (timestamp, body)
+    # A fresh Response per probe; only the body bytes are shared
+    return current_app.response_class(body, mimetype="application/json")
+
+# (directory, directory st_mtime_ns, file entries) from the last listing scan; replaced as a whole
+_listing_cache = (None, None, None)
+
+# A directory modified more recently than this may change again within the same
+# filesystem timestamp tick, so such scans are neither cached nor given an ETag
+LISTING_SETTLE_NS = 1_000_000_000
+
+def _scan_generated(generated_path):
+    """File entries of generated_path, newest first, with one stat per file."""
+    entries = []
+    with os.scandir(generated_path) as it:
+        for entry in it:
+            if entry.is_file():
+                st = entry.stat()
+                entries.append((st.st_ctime, {
+                    "filename": entry.name,
+                    "size_bytes": st.st_size,
+                    "created": datetime.fromtimestamp(st.st_ctime).isoformat(),
+                    "download_url": f"/downloads/{entry.name}"
+                }))
+
+    # Sort by creation time, newest first
+    entries.sort(key=lambda item: item[0], reverse=True)
+    return [info for _, info in entries]
 
 @web_bp.route("/api/downloads/list")
 def list_downloads():
     """List all generated files available for download."""
+    global _listing_cache
     output_dir = current_app.config.get("UPLOAD_FOLDER")
-    generated_path = Path(output_dir) / "generated"
+    generated_path = str(Path(output_dir) / "generated")
 
-    if not generated_path.exists():
-        return jsonify({
+    try:
+        dir_mtime = os.stat(generated_path).st_mtime_ns
+    except FileNotFoundError:
+        return _jsonify({
             "status": "success",
             "files": [],
             "count": 0,
             "message": "No files generated yet"
         })
 
-    files = []
-    for file_path in generated_path.iterdir():
-        if file_path.is_file():
-            files.append({
-                "filename": file_path.name,
-                "size_bytes": file_path.stat().st_size,
-                "created": datetime.fromtimestamp(file_path.stat().st_ctime).isoformat(),
-                "download_url": f"/downloads/{file_path.name}"
-            })
-
-    # Sort by creation time, newest first
-    files.sort(key=lambda x: x['created'], reverse=True)
-
-    return jsonify({
+    settled = time.time_ns() - dir_mtime >= LISTING_SETTLE_NS
+    etag = f"{dir_mtime:x}"
+    if settled and request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+        response.set_etag(etag)
+        return response
+
+    # Rescan only when the directory changed since the last listing
+    cached_path, cached_mtime, files = _listing_cache
+    if cached_path != generated_path or cached_mtime != dir_mtime:
+        files = _scan_generated(generated_path)
+        if settled:
+            _listing_cache = (generated_path, dir_mtime, files)
+
+    response = _jsonify({
         "status": "success",
         "files": files,
         "count": len(files),
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     })
+    if settled:
+        # Clients must revalidate, but an unchanged directory costs only a 304
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "no-cache"
+    return response
 
 @web_bp.route("/api/downloads/<filename>")
 def download_file(filename):
@@ -241,12 +551,47 @@ def download_file(filename):
 
     # Security: prevent directory traversal
     safe_filename = Path(filename).name
-    file_path = generated_path / safe_filename
 
-    if not file_path.exists():
-        return jsonify({"error": "File not found"}), 404
-
-    return send_from_directory(generated_path, safe_filename, as_attachment=True)
+    # send_from_directory stats the file itself and answers conditional requests with 304
+    try:
+        return send_from_directory(generated_path, safe_filename, as_attachment=True)
+    except NotFound:
+        return _jsonify({"error": "File not found"}, 404)
+
+class _ZipChunkSink:
+    """Write-only, unseekable file object that collects zipfile output for streaming."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        chunks, self._chunks = self._chunks, []
+        return chunks
+
+def _iter_zip(entries):
+    """Yield a ZIP archive of directory entries chunk by chunk; memory stays at one read buffer."""
+    sink = _ZipChunkSink()
+    with zipfile.ZipFile(sink, 'w') as zip_file:
+        for file_path in entries:
+            # from_file records the size up front so ZIP64 is used only when needed
+            zinfo = zipfile.ZipInfo.from_file(file_path, arcname=file_path.name)
+            if os.path.splitext(file_path.name)[1].lower() in ZIP_DEFLATE_SUFFIXES:
+                zinfo.compress_type = zipfile.ZIP_DEFLATED
+            else:
+                zinfo.compress_type = zipfile.ZIP_STORED
+            with open(file_path, 'rb') as src, zip_file.open(zinfo, 'w') as dst:
+                while chunk := src.read(ZIP_READ_SIZE):
+                    dst.write(chunk)
+                    yield from sink.drain()
+            yield from sink.drain()
+    yield from sink.drain()
 
 @web_bp.route("/api/downloads/zip")
 def download_all_zip():
@@ -254,27 +599,27 @@ def download_all_zip():
     output_dir = current_app.config.get("UPLOAD_FOLDER")
     generated_path = Path(output_dir) / "generated"
 
-    if not generated_path.exists() or not any(generated_path.iterdir()):
-        return jsonify({"error": "No files available for download"}), 404
-
-    # Create ZIP file in memory
-    zip_buffer = io.BytesIO()
-
-    # Use context manager to ensure proper closure
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-        for file_path in generated_path.iterdir():
-            if file_path.is_file():
-                zip_file.write(file_path, arcname=file_path.name)
+    # One directory walk; DirEntry caches the file-type check
+    try:
+        with os.scandir(generated_path) as it:
+            entries = [entry for entry in it if entry.is_file()]
+    except FileNotFoundError:
+        entries = []
 
-    # Important: seek to beginning AFTER closing the zip
-    zip_buffer.seek(0)
+    if not entries:
+        return _jsonify({"error": "No files available for download"}, 404)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # YYYYMMDD_HHMMSS from the shared per-second timestamp
+    timestamp = _now_iso().translate(_FILENAME_TS_TRANS).replace("T", "_")
     zip_filename = f"synthetic_health_data_{timestamp}.zip"
 
-    return send_file(
-        zip_buffer,
+    # Stream the archive as it is built instead of assembling it in memory
+    return current_app.response_class(
+        _iter_zip(entries),
         mimetype='application/zip',
-        as_attachment=True,
-        download_name=zip_filename
-    )
\ No newline at end of file
+        headers={
+            "Content-Disposition": f'attachment; filename="{zip_filename}"',
+            # Tell nginx to pass chunks through instead of buffering the whole archive
+            "X-Accel-Buffering": "no"
+        }
+    )
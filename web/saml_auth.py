@@ -11,19 +11,53 @@ Supports identity providers like:
 """
 
 import os
+import hashlib
 import logging
-from functools import wraps
+from functools import lru_cache, wraps
 from flask import Blueprint, request, redirect, session, url_for, make_response, jsonify
 from onelogin.saml2.auth import OneLogin_Saml2_Auth
+from onelogin.saml2.settings import OneLogin_Saml2_Settings
 from onelogin.saml2.utils import OneLogin_Saml2_Utils
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import; the environment is fixed for the life of the process
+SAML_ENABLED = os.environ.get('SAML_ENABLED', 'false').lower() == 'true'
+
+# Attribute claims sent by Entra ID; other IdPs use the short names as fallbacks
+_CLAIM_EMAIL = 'http://schemas.xmlsoap.org/ws/2005/05/identity/claims/emailaddress'
+_CLAIM_NAME = 'http://schemas.xmlsoap.org/ws/2005/05/identity/claims/name'
+_CLAIM_GROUPS = 'http://schemas.microsoft.com/ws/2008/06/identity/claims/groups'
+
+def _first(attributes, claim, alt):
+    """First value of claim, or of alt when claim is missing or empty; '' if neither has one."""
+    values = attributes.get(claim) or attributes.get(alt)
+    return values[0] if values else ''
+
 saml_bp = Blueprint('saml', __name__, url_prefix='/saml')
 
+@lru_cache(maxsize=1)
+def get_cached_saml_settings():
+    """
+    Parsed SAML settings, loaded from disk once per process.
+    Changes to settings.json or the IdP certificate need a restart.
+    """
+    return OneLogin_Saml2_Settings(custom_base_path=get_saml_settings_path(), sp_validation_only=False)
+
+@lru_cache(maxsize=1)
+def get_cached_sp_metadata():
+    """
+    SP metadata as (body, etag, validation errors).
+    Deterministic for fixed settings, so it is generated and validated once.
+    """
+    settings = get_cached_saml_settings()
+    metadata = settings.get_sp_metadata()
+    body = metadata.encode('utf-8') if isinstance(metadata, str) else metadata
+    return body, hashlib.sha256(body).hexdigest()[:16], tuple(settings.validate_metadata(metadata))
+
 def init_saml_auth(req):
     """Initialize SAML authentication object with settings."""
-    auth = OneLogin_Saml2_Auth(req, custom_base_path=get_saml_settings_path())
+    auth = OneLogin_Saml2_Auth(req, old_settings=get_cached_saml_settings())
     return auth
 
 def get_saml_settings_path():
@@ -57,13 +91,12 @@ def saml_required(f):
         def protected_route():
             return f"Hello {session['saml_user_email']}"
     """
+    if not SAML_ENABLED:
+        # SAML not enabled: leave the route undecorated so requests pay nothing
+        return f
+
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        # Check if SAML is enabled
-        if not os.environ.get('SAML_ENABLED', 'false').lower() == 'true':
-            # SAML not enabled, check for API key or allow access
-            return f(*args, **kwargs)
-
         # Check if user is authenticated via SAML
         if 'saml_authenticated' not in session or not session['saml_authenticated']:
             # Store the original URL to redirect back after login
@@ -80,19 +113,18 @@ def metadata():
     Provides SP (Service Provider) metadata to IdP for configuration.
     """
     try:
-        req = prepare_flask_request(request)
-        auth = init_saml_auth(req)
-        settings = auth.get_settings()
-        metadata = settings.get_sp_metadata()
-        errors = settings.validate_metadata(metadata)
+        metadata, etag, errors = get_cached_sp_metadata()
 
         if len(errors) == 0:
             resp = make_response(metadata, 200)
             resp.headers['Content-Type'] = 'text/xml'
-            return resp
+            resp.headers['Cache-Control'] = 'public, max-age=3600'
+            resp.set_etag(etag)
+            # Answers If-None-Match with 304 and no body
+            return resp.make_conditional(request)
         else:
             logger.error(f"SAML metadata validation errors: {errors}")
-            return jsonify({'error': 'Error generating metadata', 'details': errors}), 500
+            return jsonify({'error': 'Error generating metadata', 'details': list(errors)}), 500
     except Exception as e:
         logger.error(f"Error generating SAML metadata: {str(e)}")
         return jsonify({'error': 'Error generating metadata', 'details': str(e)}), 500
@@ -140,12 +172,9 @@ def acs():
 
                 # Get user attributes from SAML response
                 attributes = auth.get_attributes()
-                session['saml_user_email'] = attributes.get('http://schemas.xmlsoap.org/ws/2005/05/identity/claims/emailaddress',
-                                                           attributes.get('email', ['']))[0]
-                session['saml_user_name'] = attributes.get('http://schemas.xmlsoap.org/ws/2005/05/identity/claims/name',
-                                                          attributes.get('name', ['']))[0]
-                session['saml_user_groups'] = attributes.get('http://schemas.microsoft.com/ws/2008/06/identity/claims/groups',
-                                                            attributes.get('groups', []))
+                session['saml_user_email'] = _first(attributes, _CLAIM_EMAIL, 'email')
+                session['saml_user_name'] = _first(attributes, _CLAIM_NAME, 'name')
+                session['saml_user_groups'] = attributes.get(_CLAIM_GROUPS) or attributes.get('groups', [])
 
                 logger.info(f"SAML login successful for user: {session['saml_user_email']}")
 
@@ -234,17 +263,8 @@ def status():
     else:
         return jsonify({'authenticated': False})
 
-def create_saml_config_template():
-    """
-    Create template SAML configuration files.
-    Call this during initialization if config files don't exist.
-    """
-    saml_path = get_saml_settings_path()
-
-    # Create settings.json template
-    settings_file = os.path.join(saml_path, 'settings.json')
-    if not os.path.exists(settings_file):
-        settings_template = '''{
+# Templates written by create_saml_config_template when no configuration exists
+_SETTINGS_TEMPLATE = '''{
     "strict": true,
     "debug": false,
     "sp": {
@@ -288,14 +308,8 @@ def create_saml_config_template():
         "digestAlgorithm": "http://www.w3.org/2001/04/xmlenc#sha256"
     }
 }'''
-        with open(settings_file, 'w') as f:
-            f.write(settings_template)
-        logger.info(f"Created SAML settings template at {settings_file}")
 
-    # Create advanced_settings.json template
-    advanced_file = os.path.join(saml_path, 'advanced_settings.json')
-    if not os.path.exists(advanced_file):
-        advanced_template = '''{
+_ADVANCED_SETTINGS_TEMPLATE = '''{
     "security": {
         "authnRequestsSigned": false,
         "wantAssertionsSigned": true
@@ -318,10 +332,37 @@ def create_saml_config_template():
         }
     }
 }'''
-        with open(advanced_file, 'w') as f:
-            f.write(advanced_template)
+
+def _write_template(path, template):
+    """Create path with template unless it exists; True if this call created it."""
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+    except FileExistsError:
+        return False
+    try:
+        os.write(fd, template.encode('utf-8'))
+    finally:
+        os.close(fd)
+    return True
+
+def create_saml_config_template():
+    """
+    Create template SAML configuration files.
+    Call this during initialization if config files don't exist.
+    Creation is exclusive, so only one of several booting workers writes each file.
+    """
+    saml_path = get_saml_settings_path()
+
+    # Create settings.json template
+    settings_file = os.path.join(saml_path, 'settings.json')
+    if _write_template(settings_file, _SETTINGS_TEMPLATE):
+        logger.info(f"Created SAML settings template at {settings_file}")
+
+    # Create advanced_settings.json template
+    advanced_file = os.path.join(saml_path, 'advanced_settings.json')
+    if _write_template(advanced_file, _ADVANCED_SETTINGS_TEMPLATE):
         logger.info(f"Created SAML advanced settings template at {advanced_file}")
 
 # Initialize SAML config on module import if enabled
-if os.environ.get('SAML_ENABLED', 'false').lower() == 'true':
+if SAML_ENABLED:
     create_saml_config_template()